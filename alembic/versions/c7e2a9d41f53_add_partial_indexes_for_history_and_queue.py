@@ -0,0 +1,44 @@
+"""add_partial_indexes_for_history_and_queue
+
+Adds partial indexes matching the two hottest filtered + ordered queries:
+- Email history: WHERE user_id = ? AND displayed ORDER BY created_at DESC
+- Queue positions: WHERE status = 'pending' ORDER BY created_at
+
+Revision ID: c7e2a9d41f53
+Revises: bbddd04b993d
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a9d41f53'
+down_revision: Union[str, Sequence[str], None] = 'bbddd04b993d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add partial indexes for email history and pending queue items."""
+    op.create_index(
+        'ix_emails_user_displayed_created',
+        'emails',
+        ['user_id', 'created_at'],
+        postgresql_where=sa.text('displayed = true'),
+    )
+    op.create_index(
+        'ix_queue_items_pending_created',
+        'queue_items',
+        ['created_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the partial indexes."""
+    op.drop_index('ix_queue_items_pending_created', table_name='queue_items')
+    op.drop_index('ix_emails_user_displayed_created', table_name='emails')
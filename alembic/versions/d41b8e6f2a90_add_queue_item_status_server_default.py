@@ -0,0 +1,43 @@
+"""add_queue_item_status_server_default
+
+Gives queue_items.status a server-side 'pending' default so rows inserted
+outside the ORM (scripts, raw SQL) start in the same state as ORM inserts.
+emails.is_confident already has a server default (false) from 3494a07fed0c;
+the model now declares it too, so autogenerate stops reporting drift.
+
+Revision ID: d41b8e6f2a90
+Revises: c7e2a9d41f53
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41b8e6f2a90'
+down_revision: Union[str, Sequence[str], None] = 'c7e2a9d41f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - default queue item status to 'pending' server-side."""
+    op.alter_column(
+        'queue_items', 'status',
+        existing_type=sa.String(length=20),
+        server_default=sa.text("'pending'"),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - remove the status server default."""
+    op.alter_column(
+        'queue_items', 'status',
+        existing_type=sa.String(length=20),
+        server_default=None,
+        existing_nullable=False,
+    )
@@ -239,7 +239,7 @@ async def get_user_emails(
                 recipient_name=e.recipient_name,
                 recipient_interest=e.recipient_interest,
                 email_message=e.email_message,
-                template_type=e.template_type.value if e.template_type else None,
+                template_type=e.template_type,  # str-valued enum; pydantic-core coerces to its value
                 is_confident=e.is_confident,
                 metadata=e.email_metadata,
                 created_at=e.created_at,
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, over
 from typing import List
 from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 import logfire
 
 from models.user import User
@@ -45,28 +46,28 @@ async def submit_batch(
                 detail="Maximum 100 items per batch"
             )
 
-        # Phase 1: Create all queue items in the database first
-        queue_items = []
-
-        for item in batch_request.items:
-            queue_item = QueueItem(
+        # Phase 1: Create all queue items in the database first.
+        # Celery task IDs are assigned up front so the rows are written in one
+        # batched INSERT + commit instead of a second UPDATE pass after dispatch.
+        queue_items = [
+            QueueItem(
                 user_id=current_user.id,
                 recipient_name=item.recipient_name,
                 recipient_interest=item.recipient_interest,
                 email_template=batch_request.email_template,
                 status=QueueStatus.PENDING,
+                celery_task_id=str(uuid4()),
             )
-            db.add(queue_item)
-            queue_items.append((queue_item, item))
-
-        db.flush()  # Assign IDs to all items
+            for item in batch_request.items
+        ]
+        db.add_all(queue_items)
         db.commit()  # Commit so items are visible to Celery workers
 
         # Phase 2: Dispatch Celery tasks now that queue items exist in the DB
         queue_item_ids = []
 
-        for queue_item, item in queue_items:
-            task = generate_email_task.apply_async(
+        for queue_item, item in zip(queue_items, batch_request.items):
+            generate_email_task.apply_async(
                 kwargs={
                     "queue_item_id": str(queue_item.id),
                     "user_id": str(current_user.id),
@@ -74,14 +75,11 @@ async def submit_batch(
                     "recipient_name": item.recipient_name,
                     "recipient_interest": item.recipient_interest,
                 },
-                queue="email_default"
+                queue="email_default",
+                task_id=queue_item.celery_task_id,
             )
-
-            queue_item.celery_task_id = task.id
             queue_item_ids.append(str(queue_item.id))
 
-        db.commit()  # Persist celery_task_id references
-
         logfire.info(
             "Batch submitted to queue",
             user_id=str(current_user.id),
@@ -115,27 +113,35 @@ async def get_queue_items(
         ).order_by(QueueItem.created_at.asc()).all()
 
         # Calculate positions for PENDING items in a single query using window function
-        # This avoids N+1 query problem (1 query instead of N queries)
-
-        positions_query = db.query(
-            QueueItem.id,
-            func.row_number().over(
-                order_by=QueueItem.created_at.asc()
-            ).label('position')
-        ).filter(
-            QueueItem.status == QueueStatus.PENDING,
-            QueueItem.created_at >= cutoff_time
-        ).all()
-
-        # Create lookup map: {item_id: position}
-        position_map = {str(item_id): position for item_id, position in positions_query}
+        # This avoids N+1 query problem (1 query instead of N queries).
+        # Positions are global, so rank all pending items in a subquery but only
+        # return the current user's rows; skip the query when nothing is pending.
+        position_map = {}
+        if any(item.status == QueueStatus.PENDING for item in items):
+            ranked = db.query(
+                QueueItem.id,
+                QueueItem.user_id,
+                func.row_number().over(
+                    order_by=QueueItem.created_at.asc()
+                ).label('position')
+            ).filter(
+                QueueItem.status == QueueStatus.PENDING,
+                QueueItem.created_at >= cutoff_time
+            ).subquery()
+
+            positions_query = db.query(ranked.c.id, ranked.c.position).filter(
+                ranked.c.user_id == current_user.id
+            ).all()
+
+            # Create lookup map: {item_id: position}
+            position_map = {item_id: position for item_id, position in positions_query}
 
         # Build response using the position map
         result = []
         for item in items:
             position = None
             if item.status == QueueStatus.PENDING:
-                position = position_map.get(str(item.id))
+                position = position_map.get(item.id)
 
             result.append(QueueItemResponse(
                 id=str(item.id),
@@ -11,7 +11,6 @@ from models.template import Template
 from database import get_db
 from api.dependencies import get_current_user, PaginationParams
 from schemas.template import GenerateTemplateRequest, TemplateResponse
-from services.template_generator import generate_template_from_resume
 from utils.uuid_helpers import ensure_uuid
 from utils.validators import validate_template_ownership
 from config.settings import settings
@@ -36,6 +35,10 @@ async def create_template(
             )
 
         try:
+            # Imported on first use: pulls in the PDF parser and LLM stack, which
+            # only this endpoint needs, so API workers boot without them
+            from services.template_generator import generate_template_from_resume
+
             # Generate template (synchronous, 5-15 seconds)
             template_text = await generate_template_from_resume(
                 pdf_url=str(request.pdf_url),
@@ -7,13 +7,13 @@ This module configures the Celery application with:
 - Retry policies and error handling
 - Worker configuration
 """
-import os
 import sys
 from pathlib import Path
 import logfire
 from celery import Celery
 from celery.signals import worker_process_init
 from config.redis_config import redis_settings
+from config.settings import settings
 
 # Add project root to Python path for module imports
 # This ensures Celery workers can resolve imports like 'from utils.llm_agent import create_agent'
@@ -92,8 +92,10 @@ def init_worker_process(**kwargs) -> None:
         sys.path.insert(0, str(project_root))
 
     # Configure Logfire for observability in worker processes
-    if os.getenv("LOGFIRE_TOKEN"):
+    # Token comes from Settings so values set only in .env are honoured too
+    if settings.logfire_token:
         logfire.configure(
+            token=settings.logfire_token,
             service_name="scribe-celery-worker",
             send_to_logfire="if-token-present",
             console=False,
@@ -111,7 +113,7 @@ def init_worker_process(**kwargs) -> None:
     logfire.info(
         "Celery worker initialized",
         project_root=str(project_root),
-        logfire_enabled=bool(os.getenv("LOGFIRE_TOKEN")),
+        logfire_enabled=bool(settings.logfire_token),
     )
 
 
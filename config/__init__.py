@@ -1,6 +1,6 @@
 """
 Configuration module for the application.
-Exports the settings instance for use throughout the application.
+Exports the (lazily constructed) settings instance for use throughout the application.
 """
 
 from config.settings import settings
@@ -1,12 +1,17 @@
 """Application configuration using Pydantic Settings."""
 
 import os
+import re
+from functools import cached_property, lru_cache
 from typing import List
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # NOTE: Logfire configured in main.py/conftest.py, not here (prevents test conflicts)
 
+# Valid CORS origin: http(s) scheme plus host[:port], nothing after it
+_CORS_ORIGIN_RE = re.compile(r"^https?://[^/]+$")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables with validation."""
@@ -45,6 +50,22 @@ class Settings(BaseSettings):
         description="Connection timeout in seconds (30s handles cold starts and network latency)"
     )
     db_statement_timeout: int = Field(default=30000, description="Statement timeout in milliseconds")
+    db_health_check_ttl_seconds: float = Field(
+        default=5.0,
+        description="How long /health reuses the last database probe result (probes only run when /health is called)"
+    )
+    # Pool settings apply to the session pooler / direct port (5432); the transaction pooler uses NullPool
+    db_pool_size: int = Field(default=5, description="Persistent connections kept by QueuePool")
+    db_max_overflow: int = Field(default=5, description="Extra connections QueuePool may open under burst load")
+    db_pool_timeout: int = Field(default=30, description="Seconds to wait for a pooled connection before erroring")
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Recycle pooled connections older than this many seconds (stays under Supabase idle timeouts)"
+    )
+    db_pool_warm_size: int = Field(
+        default=5,
+        description="Connections opened at startup to prime the pool (no-op with NullPool)"
+    )
 
     # Supabase Configuration
     supabase_url: str = Field(..., description="Supabase project URL")
@@ -66,6 +87,10 @@ class Settings(BaseSettings):
         #default="anthropic:claude-sonnet-4-5",
         default="fireworks:accounts/fireworks/models/kimi-k2p5",
     )
+    email_composer_fallback_model: str = Field(
+        default="anthropic:claude-sonnet-4-5",
+        description="Stronger model retried when the composer output is unparseable or leaves placeholders unfilled (empty disables)"
+    )
     template_generator_model: str = Field(
         #default="anthropic:claude-haiku-4-5",
         default="fireworks:accounts/fireworks/models/kimi-k2p5",
@@ -94,9 +119,12 @@ class Settings(BaseSettings):
     @field_validator("allowed_origins")
     @classmethod
     def parse_origins(cls, v: str) -> List[str]:
-        """Parse comma-separated origins into a list."""
+        """Parse comma-separated origins into a de-duplicated list without trailing slashes."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
+            # Browsers send Origin without a trailing slash, so normalize for exact matching
+            return list(dict.fromkeys(
+                origin.strip().rstrip("/") for origin in v.split(",") if origin.strip()
+            ))
         return v
 
     @field_validator("db_host")
@@ -141,21 +169,35 @@ class Settings(BaseSettings):
 
         return self
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
-        """Check if running in development mode."""
+        """Check if running in development mode (computed once per instance)."""
         return self.environment.lower() == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
-        """Check if running in production mode."""
+        """Check if running in production mode (computed once per instance)."""
         return self.environment.lower() == "production"
 
-    @property
+    @cached_property
+    def has_wildcard_origin(self) -> bool:
+        """Whether ALLOWED_ORIGINS contains '*' (computed once per instance)."""
+        return "*" in self.allowed_origins
+
+    @cached_property
+    def invalid_origins(self) -> List[str]:
+        """Configured CORS origins that are not scheme://host[:port] (computed once per instance)."""
+        return [
+            origin for origin in self.allowed_origins
+            if origin != "*" and not _CORS_ORIGIN_RE.match(origin)
+        ]
+
+    @cached_property
     def database_url(self) -> str:
         """
         Construct the SQLAlchemy database URL for Supabase direct connection.
         Uses psycopg2 driver and requires SSL mode for Supabase connections.
+        Built once per instance; the DB fields are not mutated after load.
         """
         return (
             f"postgresql+psycopg2://{self.db_user}:{self.db_password}@"
@@ -163,18 +205,34 @@ class Settings(BaseSettings):
         )
 
 
-# Create a singleton instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> "Settings":
+    """Build the settings singleton on first use (parses .env and runs validators once)."""
+    instance = Settings()
+
+    # Ensure SDKs that read ANTHROPIC_API_KEY at import time see the configured value.
+    os.environ.setdefault("ANTHROPIC_API_KEY", instance.anthropic_api_key)
 
-# Ensure SDKs that read ANTHROPIC_API_KEY at import time see the configured value.
-os.environ.setdefault("ANTHROPIC_API_KEY", settings.anthropic_api_key)
+    os.environ.setdefault("FIREWORKS_API_KEY", instance.fireworks_api_key)
 
-os.environ.setdefault("FIREWORKS_API_KEY", settings.fireworks_api_key)
+    return instance
 
-def get_settings() -> "Settings":
-    """Return the singleton settings instance.
 
-    Provided for backward-compatibility with modules that import
-    `config.settings.get_settings` instead of the `settings` variable.
+class _LazySettings:
     """
-    return settings
+    Module-level stand-in for the Settings singleton.
+
+    Keeps `from config.settings import settings` working while deferring
+    construction until an attribute is first read.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+
+settings = _LazySettings()
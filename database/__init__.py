@@ -3,14 +3,17 @@ Database module initialization.
 Exports database components for use throughout the application.
 """
 
-from database.base import Base, engine, SessionLocal
+from database.base import Base, get_engine, get_session_factory
 from database.session import get_db_context
 from database.dependencies import get_db
 from database.utils import (
     check_db_connection,
     get_db_info,
+    get_pool_status,
+    warm_connection_pool,
 )
 from database.retry_utils import (
+    STARTUP_RETRY_POLICY,
     retry_on_db_error,
     retry_on_db_error_async,
 )
@@ -18,8 +21,8 @@ from database.retry_utils import (
 __all__ = [
     # Base components
     "Base",
-    "engine",
-    "SessionLocal",
+    "get_engine",
+    "get_session_factory",
     # Session management
     "get_db_context",
     # FastAPI dependencies
@@ -27,7 +30,22 @@ __all__ = [
     # Utilities
     "check_db_connection",
     "get_db_info",
+    "get_pool_status",
+    "warm_connection_pool",
     # Retry utilities
+    "STARTUP_RETRY_POLICY",
     "retry_on_db_error",
     "retry_on_db_error_async",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Resolve `engine` / `SessionLocal` lazily so importing the package does not build an engine.
+    Deliberately left out of __all__: a star import would otherwise build the engine.
+    """
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
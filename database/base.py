@@ -6,43 +6,90 @@ This module provides the core database infrastructure:
 - Declarative base for ORM models
 """
 
+from functools import lru_cache
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 
 from config import settings
 
 
+TRANSACTION_POOLER_PORT = 6543
+
+
+def _pool_options() -> dict:
+    """
+    Pick the pool for the configured Supabase endpoint.
+    - Transaction pooler (6543): NullPool, Supavisor already pools server-side, so
+      an app-side pool would double-pool and hold stale connections
+    - Session pooler / direct (5432): QueuePool, reusing connections skips the
+      TCP + TLS + auth handshake on every request; pool_recycle retires
+      connections before the server's idle timeout closes them
+    """
+    if settings.db_port == TRANSACTION_POOLER_PORT:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": QueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
+
 def _create_engine():
     """
-    Create SQLAlchemy engine with NullPool for Supabase Transaction Pooler.
-    - Eliminates double-pooling (app-side + server-side)
-    - Prevents stale connection accumulation
+    Create the SQLAlchemy engine for Supabase (pool chosen by _pool_options).
     - Optimizes for single-server deployments (Raspberry Pi via Cloudflare Tunnel)
-    - Connections are created per-request and immediately discarded
     - Connection pre-ping adds safety for Cloudflare tunnel stability
     """
     return create_engine(
         settings.database_url,
-        poolclass=NullPool,
         pool_pre_ping=True,  # Test connection health before use (Cloudflare tunnel safety)
         connect_args={
             "connect_timeout": settings.db_connect_timeout,
             "options": f"-c statement_timeout={settings.db_statement_timeout}",
         },
         echo=settings.is_development,
+        **_pool_options(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Return the process-wide engine, creating it on first use.
+    Importing models or config no longer builds an engine; tests can swap it via cache_clear().
+    """
+    return _create_engine()
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker:
+    """
+    Return the SessionLocal factory bound to the shared engine.
+    expire_on_commit=False: objects stay readable after commit without a reload
+    SELECT per instance; callers that need server-side values use db.refresh()
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=get_engine(),
     )
 
 
-# Create engine with configuration
-engine = _create_engine()
+def __getattr__(name: str):
+    """Lazily resolve `engine` and `SessionLocal` for `from database.base import ...` callers."""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Create SessionLocal factory for database sessions
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
 
-# Create declarative base for ORM models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for ORM models (SQLAlchemy 2.0 style)."""
+    pass
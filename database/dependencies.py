@@ -5,21 +5,28 @@ Provides database session dependencies for API endpoints.
 
 from typing import Generator
 
-from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from database.base import SessionLocal
+from database.base import get_session_factory
 from database.retry_utils import retry_on_db_error
 
 
 @retry_on_db_error
 def _create_db_session() -> Session:
     """
-    Create and validate a database session.
+    Create a database session with its connection already checked out.
     Wrapped with retry logic for transient connection failures.
+
+    Checking out the connection surfaces connect errors here (where they can
+    be retried) without a SELECT 1 round trip on every request; liveness of
+    reused connections is covered by the engine's pool_pre_ping.
     """
-    db = SessionLocal()
-    db.execute(text("SELECT 1"))  # Validate connection
+    db = get_session_factory()()
+    try:
+        db.connection()
+    except Exception:
+        db.close()
+        raise
     return db
 
 
@@ -1,52 +1,114 @@
-"""Database retry helpers for transient SQLAlchemy OperationalError failures."""
+"""Database retry helpers for transient SQLAlchemy OperationalError failures (jittered exponential backoff)."""
 
 import asyncio
+import random
+import re
 import time
+from dataclasses import dataclass
 from typing import Awaitable, Callable, TypeVar
 from functools import wraps
 
 import logfire
 from sqlalchemy.exc import OperationalError
 
-from database.base import engine
+from database.base import get_engine
 
 T = TypeVar("T")
 
 # Centralized retry configuration
 MAX_RETRIES = 3
-RETRY_DELAY_SECONDS = 0.5  # Fixed delay between attempts
+RETRY_DELAY_SECONDS = 0.5  # Base delay; doubles per attempt with +/-50% jitter
+MAX_RETRY_DELAY_SECONDS = 8.0  # Cap on the exponential term before jitter
+
+# OperationalErrors that can never succeed on retry (bad credentials, missing
+# database/role). Everything else (DNS/network blips, refused or dropped
+# connections, exhausted connection slots, pooler crashes) is treated as
+# transient, so an unfamiliar message errs on the side of retrying.
+# SQLSTATE class 28 = invalid authorization, 3D000 = invalid catalog name.
+_PERMANENT_SQLSTATE_RE = re.compile(r"^(28...|3D000)$")
+_PERMANENT_ERROR_RE = re.compile(
+    r"authentication failed|no pg_hba\.conf entry"
+    r"|(database|role) \"[^\"]*\" does not exist|tenant or user not found",
+    re.IGNORECASE,
+)
+
+
+def is_retryable_db_error(error: OperationalError) -> bool:
+    """Return False only for errors that are definitely permanent; retry everything else."""
+    # Server-reported errors carry a SQLSTATE; connection-time libpq errors only have a message
+    pgcode = getattr(error.orig, "pgcode", None)
+    if pgcode and _PERMANENT_SQLSTATE_RE.match(pgcode):
+        return False
+    return _PERMANENT_ERROR_RE.search(str(error)) is None
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Immutable retry settings, captured once per decorated function."""
+
+    max_retries: int = MAX_RETRIES
+    base_delay: float = RETRY_DELAY_SECONDS
+    max_delay: float = MAX_RETRY_DELAY_SECONDS
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Capped exponential backoff with jitter so concurrent requests don't retry in lockstep."""
+        return min(self.base_delay * (2 ** (attempt - 1)), self.max_delay) * random.uniform(0.5, 1.5)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Startup can afford more attempts (no request is waiting), e.g. while Postgres fails over
+STARTUP_RETRY_POLICY = RetryPolicy(max_retries=5)
+
+
+def _reset_pool_after_exhausted_retries(error: OperationalError) -> None:
+    """
+    Last-resort pool reset once a transient error has survived every retry.
+
+    Individual retries don't dispose the engine: SQLAlchemy already invalidates
+    the broken connection on disconnect errors, and pool_pre_ping weeds out any
+    other dead ones, so tearing down every pooled connection would only force
+    unrelated in-flight requests to reconnect.
+    """
+    if is_retryable_db_error(error):
+        get_engine().dispose()
 
 
 def retry_on_db_error(func: Callable[..., T]) -> Callable[..., T]:
-    """Decorator: retry sync DB operations on OperationalError with a fixed delay."""
+    """Decorator: retry sync DB operations on transient OperationalError with jittered backoff."""
+    # Resolved once at decoration time and read from the closure on each attempt
+    policy = DEFAULT_RETRY_POLICY
+    max_retries = policy.max_retries
+    func_name = func.__name__
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> T:
-        for attempt in range(1, MAX_RETRIES + 1):
+        for attempt in range(1, max_retries + 1):
             try:
                 return func(*args, **kwargs)
 
             except OperationalError as e:
                 error_msg = str(e)
 
-                if attempt < MAX_RETRIES:
+                if attempt < max_retries and is_retryable_db_error(e):
+                    delay = policy.backoff_delay(attempt)
                     logfire.warning(
                         "Database operation failed, retrying",
-                        function=func.__name__,
+                        function=func_name,
                         error=error_msg[:200],
                         attempt=attempt,
-                        max_attempts=MAX_RETRIES,
-                        retry_delay=RETRY_DELAY_SECONDS,
+                        max_attempts=max_retries,
+                        retry_delay=round(delay, 3),
                     )
-                    engine.dispose()  # Clear stale connections
-                    time.sleep(RETRY_DELAY_SECONDS)
+                    time.sleep(delay)
                 else:
                     logfire.error(
                         "Database operation failed after all retries",
-                        function=func.__name__,
+                        function=func_name,
                         error=error_msg[:200],
-                        attempts=MAX_RETRIES,
+                        attempts=attempt,
                     )
+                    _reset_pool_after_exhausted_retries(e)
                     raise
 
         raise RuntimeError("Unreachable: retry loop must return or raise")  # pragma: no cover
@@ -54,31 +116,37 @@ def retry_on_db_error(func: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
-async def retry_on_db_error_async(func: Callable[[], Awaitable[T]]) -> T:
-    """Run an async DB operation with retries on OperationalError and a fixed delay."""
-    for attempt in range(1, MAX_RETRIES + 1):
+async def retry_on_db_error_async(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> T:
+    """Run an async DB operation with retries on transient OperationalError and jittered backoff."""
+    max_retries = policy.max_retries
+
+    for attempt in range(1, max_retries + 1):
         try:
             return await func()
 
         except OperationalError as e:
             error_msg = str(e)
 
-            if attempt < MAX_RETRIES:
+            if attempt < max_retries and is_retryable_db_error(e):
+                delay = policy.backoff_delay(attempt)
                 logfire.warning(
                     "Async database operation failed, retrying",
                     error=error_msg[:200],
                     attempt=attempt,
-                    max_attempts=MAX_RETRIES,
-                    retry_delay=RETRY_DELAY_SECONDS,
+                    max_attempts=max_retries,
+                    retry_delay=round(delay, 3),
                 )
-                engine.dispose()  # Clear stale connections
-                await asyncio.sleep(RETRY_DELAY_SECONDS)
+                await asyncio.sleep(delay)
             else:
                 logfire.error(
                     "Async database operation failed after all retries",
                     error=error_msg[:200],
-                    attempts=MAX_RETRIES,
+                    attempts=attempt,
                 )
+                _reset_pool_after_exhausted_retries(e)
                 raise
 
     raise RuntimeError("Unreachable: retry loop must return or raise")  # pragma: no cover
@@ -8,7 +8,7 @@ from typing import Generator
 
 from sqlalchemy.orm import Session
 
-from database.base import SessionLocal
+from database.base import get_session_factory
 
 
 @contextmanager
@@ -25,7 +25,7 @@ def get_db_context() -> Generator[Session, None, None]:
             db.add(user)
             db.commit()
     """
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     except Exception:
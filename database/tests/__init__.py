@@ -0,0 +1 @@
+# blank init to allow tests to be run from this directory
@@ -0,0 +1,70 @@
+"""
+Test suite for database/base.py
+
+Guards against the engine, session factory or declarative Base being
+defined in more than one module (each extra create_engine allocates its
+own pool). No database connection is required.
+
+Run with:
+    pytest database/tests/test_base.py -v
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy.pool import NullPool, QueuePool
+
+import database
+import models
+from config.settings import get_settings
+from database import base
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SKIP_DIRS = {"venv", ".venv", ".git", "alembic", "__pycache__"}
+
+
+@pytest.mark.unit
+def test_engine_and_session_factory_are_singletons():
+    """Package-level and module-level names resolve to the same cached objects."""
+    assert database.engine is base.get_engine()
+    assert database.SessionLocal is base.get_session_factory()
+    assert base.get_session_factory().kw["bind"] is base.get_engine()
+
+
+@pytest.mark.unit
+def test_models_share_one_declarative_base():
+    """All ORM models register on the single Base exported by the database package."""
+    assert database.Base is base.Base
+    for model in (models.User, models.Email, models.Template, models.QueueItem):
+        assert model.metadata is base.Base.metadata
+
+
+@pytest.mark.unit
+def test_create_engine_only_called_in_database_base():
+    """No other application module builds its own engine."""
+    offenders = []
+    for path in PROJECT_ROOT.rglob("*.py"):
+        if SKIP_DIRS.intersection(path.relative_to(PROJECT_ROOT).parts):
+            continue
+        if path == Path(base.__file__).resolve() or path == Path(__file__).resolve():
+            continue
+        if "create_engine(" in path.read_text(encoding="utf-8", errors="ignore"):
+            offenders.append(str(path.relative_to(PROJECT_ROOT)))
+
+    assert offenders == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "port, expected_pool",
+    [(base.TRANSACTION_POOLER_PORT, NullPool), (5432, QueuePool)],
+)
+def test_pool_class_follows_pooler_port(monkeypatch, port, expected_pool):
+    """Transaction pooler gets NullPool (no double pooling); session pooler/direct keeps a QueuePool."""
+    monkeypatch.setattr(get_settings(), "db_port", port)
+    options = base._pool_options()
+
+    assert options["poolclass"] is expected_pool
+    if expected_pool is QueuePool:
+        assert options["pool_recycle"] == get_settings().db_pool_recycle
@@ -0,0 +1,95 @@
+"""
+Test suite for database/retry_utils.py
+
+Checks which OperationalErrors are retried (everything except definitely
+permanent failures) using synthetic errors. No database connection is required.
+
+Run with:
+    pytest database/tests/test_retry_utils.py -v
+"""
+
+from typing import Optional
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from database import retry_utils
+from database.retry_utils import is_retryable_db_error, retry_on_db_error
+
+
+class _DriverError(Exception):
+    """Stand-in for a psycopg2 error, optionally carrying a SQLSTATE."""
+
+    def __init__(self, message: str, pgcode: Optional[str] = None):
+        super().__init__(message)
+        self.pgcode = pgcode
+
+
+def _operational_error(message: str, pgcode: Optional[str] = None) -> OperationalError:
+    return OperationalError("SELECT 1", {}, _DriverError(message, pgcode))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("message", [
+    'could not translate host name "db.example.supabase.co" to address: Name or service not known',
+    "could not connect to server: Network is unreachable",
+    "could not connect to server: No route to host",
+    "FATAL: sorry, too many clients already (too many connections)",
+    "FATAL: remaining connection slots are reserved for non-replication superuser connections",
+    "server conn crashed?",
+    "connection to server failed: Connection refused",
+    "server closed the connection unexpectedly",
+    "timeout expired",
+    "some driver message we have never seen before",
+])
+def test_transient_errors_are_retryable(message):
+    """Network, capacity and pooler failures are retried, including unknown messages."""
+    assert is_retryable_db_error(_operational_error(message)) is True
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("message", [
+    'FATAL: password authentication failed for user "postgres"',
+    'FATAL: database "scribe" does not exist',
+    'FATAL: role "scribe_app" does not exist',
+    'FATAL: no pg_hba.conf entry for host "10.0.0.1", user "postgres"',
+    "FATAL: Tenant or user not found",
+])
+def test_permanent_error_messages_are_not_retryable(message):
+    """Bad credentials and missing databases/roles fail on the first attempt."""
+    assert is_retryable_db_error(_operational_error(message)) is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pgcode", ["28000", "28P01", "3D000"])
+def test_permanent_sqlstates_are_not_retryable(pgcode):
+    """SQLSTATE class 28 and 3D000 are permanent regardless of message text."""
+    assert is_retryable_db_error(_operational_error("server error", pgcode)) is False
+
+
+@pytest.mark.unit
+def test_decorator_retries_transient_and_stops_on_permanent(monkeypatch):
+    """The sync decorator retries a DNS blip but raises a permanent error immediately."""
+    monkeypatch.setattr(retry_utils.time, "sleep", lambda _: None)
+    monkeypatch.setattr(retry_utils, "_reset_pool_after_exhausted_retries", lambda _: None)
+
+    calls = {"transient": 0, "permanent": 0}
+
+    @retry_on_db_error
+    def flaky():
+        calls["transient"] += 1
+        if calls["transient"] == 1:
+            raise _operational_error("could not translate host name")
+        return "ok"
+
+    @retry_on_db_error
+    def misconfigured():
+        calls["permanent"] += 1
+        raise _operational_error("password authentication failed")
+
+    assert flaky() == "ok"
+    assert calls["transient"] == 2
+
+    with pytest.raises(OperationalError):
+        misconfigured()
+    assert calls["permanent"] == 1
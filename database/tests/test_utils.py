@@ -0,0 +1,84 @@
+"""
+Test suite for database/utils.py
+
+Covers the health probe's idle-pool fast path with stub engines, so no
+database connection is required.
+
+Run with:
+    pytest database/tests/test_utils.py -v
+"""
+
+import time
+
+import pytest
+from sqlalchemy.pool import NullPool, QueuePool
+
+from database import utils
+
+
+class _StubEngine:
+    """Counts connect() calls and exposes a stub pool."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _pool(pool_class, checked_in: int):
+    pool = pool_class.__new__(pool_class)
+    pool.checkedin = lambda: checked_in
+    return pool
+
+
+@pytest.fixture
+def stub_engine(monkeypatch):
+    def install(pool):
+        engine = _StubEngine(pool)
+        monkeypatch.setattr(utils, "get_engine", lambda: engine)
+        return engine
+
+    monkeypatch.setattr(utils, "_last_probe_ok", None)
+    return install
+
+
+@pytest.mark.unit
+def test_idle_queue_pool_skips_probe_after_recent_success(stub_engine):
+    """A recent real probe plus idle pooled connections answers without a checkout."""
+    engine = stub_engine(_pool(QueuePool, checked_in=2))
+
+    assert utils._test_db_connection() == (True, None)
+    assert utils._test_db_connection() == (True, None)
+    assert engine.connects == 1
+
+
+@pytest.mark.unit
+def test_stale_success_probes_again(stub_engine, monkeypatch):
+    """Once half of DB_POOL_RECYCLE has passed the database is probed again."""
+    engine = stub_engine(_pool(QueuePool, checked_in=2))
+    monkeypatch.setattr(utils, "_last_probe_ok", time.monotonic() - utils.settings.db_pool_recycle)
+
+    utils._test_db_connection()
+
+    assert engine.connects == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pool", [_pool(QueuePool, checked_in=0), _pool(NullPool, checked_in=0)])
+def test_empty_or_null_pool_always_probes(stub_engine, pool):
+    """Without idle connections (or on NullPool) every call opens a connection."""
+    engine = stub_engine(pool)
+
+    utils._test_db_connection()
+    utils._test_db_connection()
+
+    assert engine.connects == 2
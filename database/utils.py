@@ -3,68 +3,146 @@ Database utility functions.
 Provides helpers for database operations and health checks.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 
-from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool, QueuePool
 
-from database.base import engine
+from database.base import get_engine
 from config import settings
 
+# Last health probe result as (monotonic timestamp, is_connected); see check_db_connection
+_health_cache: Optional[Tuple[float, bool]] = None
+_health_lock = threading.Lock()
+# Monotonic timestamp of the last probe that actually reached the database
+_last_probe_ok: Optional[float] = None
+
 
 def _test_db_connection() -> Tuple[bool, Optional[str]]:
     """
-    Attempt a simple database connection and return success plus error details.
+    Attempt a database connection and return success plus error details.
+
+    Opening the connection already proves the server is reachable and accepts
+    our credentials (and pool_pre_ping validates any reused connection), so no
+    SELECT 1 round trip is issued.
+
+    QueuePool fast path: if idle connections are sitting in the pool and a real
+    probe succeeded within half of DB_POOL_RECYCLE, the pool is known healthy and
+    no connection is checked out (checkout would pre-ping it). NullPool never
+    holds idle connections, so the transaction pooler always probes.
     """
+    global _last_probe_ok
+
+    engine = get_engine()
+    pool = engine.pool
+    last_ok = _last_probe_ok
+    if (
+        isinstance(pool, QueuePool)
+        and pool.checkedin() > 0
+        and last_ok is not None
+        and time.monotonic() - last_ok < settings.db_pool_recycle / 2
+    ):
+        return True, None
+
     try:
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
+        with engine.connect():
+            pass
+        _last_probe_ok = time.monotonic()
         return True, None
     except OperationalError as exc:
+        _last_probe_ok = None
         return False, str(exc)
     except Exception as exc:
+        _last_probe_ok = None
         return False, f"{exc.__class__.__name__}: {exc}"
 
 
-def check_db_connection() -> bool:
+def check_db_connection(force: bool = False) -> bool:
     """
     Check if database connection is working.
 
+    Results are reused for DB_HEALTH_CHECK_TTL_SECONDS so frequent health
+    probes collapse into one round trip per TTL window.
+
+    Args:
+        force: Skip the cache and always probe the database
+
     Returns:
         bool: True if connection is successful, False otherwise
     """
-    is_connected, _ = _test_db_connection()
-    return is_connected
+    global _health_cache
+
+    ttl = settings.db_health_check_ttl_seconds
+    cached = _health_cache
+    if not force and cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    with _health_lock:
+        # Another thread may have refreshed the result while we waited
+        cached = _health_cache
+        if not force and cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        is_connected, _ = _test_db_connection()
+        _health_cache = (time.monotonic(), is_connected)
+        return is_connected
 
 
+def _probe_and_record() -> Tuple[bool, Optional[str]]:
+    """Run one connection probe and seed the health cache with its outcome."""
+    global _health_cache
+
+    is_connected, error = _test_db_connection()
+    with _health_lock:
+        _health_cache = (time.monotonic(), is_connected)
+    return is_connected, error
+
+
+@lru_cache(maxsize=4)
 def sanitize_db_url(url: str) -> str:
     """
     Hide password in database URL for safe logging.
 
     Replaces the password portion of a database connection URL with "***"
     to prevent credentials from appearing in logs or error messages.
+    Cached because callers pass the same constant settings URL repeatedly.
     """
-    if "@" not in url:
-        return url
-
     try:
-        protocol, rest = url.split("://", 1)
-        credentials, host = rest.split("@", 1)
-        username = credentials.split(":", 1)[0]
-        return f"{protocol}://{username}:***@{host}"
+        parts = urlsplit(url)
     except ValueError:
         return url
 
+    if parts.password is None:
+        return url
+
+    # Keep host/port exactly as written (IPv6 brackets, casing) by splitting on the last '@'
+    host = parts.netloc.rpartition("@")[2]
+    return urlunsplit(parts._replace(netloc=f"{parts.username}:***@{host}"))
+
+
+@lru_cache(maxsize=1)
+def _sanitized_db_url() -> str:
+    """Sanitized form of the configured database URL, computed once (settings are immutable)."""
+    return sanitize_db_url(settings.database_url)
+
 
 def get_db_info() -> dict:
     """
     Get database connection information and status.
 
+    The probe result also seeds the check_db_connection cache, so a health
+    check right after startup does not open a second connection.
+
     Returns:
         dict: Database information including connection status and URL (sanitized)
     """
-    is_connected, error = _test_db_connection()
-    db_url_sanitized = sanitize_db_url(settings.database_url)
+    is_connected, error = _probe_and_record()
+    db_url_sanitized = _sanitized_db_url()
 
     info = {
         "status": "connected" if is_connected else "disconnected",
@@ -74,3 +152,55 @@ def get_db_info() -> dict:
     if not is_connected:
         info["error"] = error
     return info
+
+
+def get_pool_status() -> dict:
+    """
+    Report connection pool utilization without touching the database.
+
+    Returns:
+        dict: Pool class and status, plus size/checked-out/overflow counts when the pool tracks them
+    """
+    pool = get_engine().pool
+    info = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    }
+    for metric in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, metric, None)
+        if callable(counter):
+            info[metric] = counter()
+    return info
+
+
+def warm_connection_pool(size: int) -> int:
+    """
+    Prime the connection pool so early requests skip the connect handshake.
+
+    Opens up to `size` connections concurrently (capped at the pool size) and
+    returns them to the pool. NullPool keeps no idle connections, so it is a no-op there.
+
+    Returns:
+        int: Number of connections that were opened
+    """
+    engine = get_engine()
+    pool = engine.pool
+    if size <= 0 or isinstance(pool, NullPool):
+        return 0
+
+    pool_size = getattr(pool, "size", None)
+    if callable(pool_size):
+        size = min(size, pool_size())
+
+    def _connect():
+        try:
+            return engine.connect()
+        except Exception:
+            return None
+
+    # Hold every connection until all are open so each worker gets a distinct one
+    with ThreadPoolExecutor(max_workers=size) as executor:
+        connections = [conn for conn in executor.map(lambda _: _connect(), range(size)) if conn is not None]
+    for conn in connections:
+        conn.close()
+    return len(connections)
@@ -4,20 +4,89 @@ Main FastAPI application entry point.
 
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logfire
+from sqlalchemy.exc import OperationalError
 
 from config import settings
-from database import check_db_connection, get_db_info
+from database import (
+    STARTUP_RETRY_POLICY,
+    check_db_connection,
+    get_db_info,
+    get_pool_status,
+    retry_on_db_error_async,
+    warm_connection_pool,
+)
 from services.supabase import get_supabase_client_safe
 from observability.logfire_config import LogfireConfig
 from api.routes import user_router, email_router, template_router, queue_router, admin_router
 
 
+async def _check_db_with_logging() -> dict:
+    """Probe the database once (in a worker thread) and raise OperationalError so failures are retried."""
+    db_info = await asyncio.to_thread(get_db_info)
+    if db_info["status"] == "connected":
+        logfire.info(
+            "Database connection successful",
+            url=db_info["url"],
+            port=settings.db_port,
+            status=db_info["status"],
+        )
+    else:
+        error_msg = db_info.get("error", "Connection check failed")
+        logfire.warning(
+            "Database connection check failed",
+            url=db_info["url"],
+            port=settings.db_port,
+            status=db_info["status"],
+            error=error_msg,
+        )
+        raise OperationalError(
+            statement=None, params=None, orig=Exception(error_msg)
+        )
+    return db_info
+
+
+async def _probe_db_with_retry() -> Optional[dict]:
+    """Startup DB check with retries; returns None instead of raising so startup continues degraded."""
+    try:
+        return await retry_on_db_error_async(_check_db_with_logging, policy=STARTUP_RETRY_POLICY)
+    except Exception as e:
+        logfire.error(
+            "Database connection failed after retries",
+            error=str(e),
+            port=settings.db_port,
+        )
+        return None
+
+
+def _log_cors_configuration() -> None:
+    """Log the CORS setup and flag unsafe or malformed origins."""
+    logfire.info(
+        "CORS configuration",
+        allowed_origins=settings.allowed_origins,
+        origin_count=len(settings.allowed_origins),
+        environment=settings.environment,
+    )
+
+    if settings.has_wildcard_origin and settings.is_production:
+        logfire.error(
+            "SECURITY WARNING: Wildcard CORS origin in production",
+            hint="Set ALLOWED_ORIGINS to specific domain in production"
+        )
+
+    if settings.invalid_origins:
+        logfire.error(
+            "Invalid CORS origins - expected scheme://host[:port]",
+            origins=settings.invalid_origins,
+            hint="Use e.g. 'https://example.com' (protocol required, no path)"
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     LogfireConfig.initialize(token=settings.logfire_token)
@@ -32,48 +101,16 @@ async def lifespan(app: FastAPI):
         "Database configuration",
         port=settings.db_port,
         host_type="transaction_pooler" if ".pooler." in settings.db_host else "direct",
-        pool_class="NullPool",
+        pool_class=get_pool_status()["pool_class"],
         connect_timeout=settings.db_connect_timeout,
     )
 
-    async def check_db_with_logging():
-        db_info = get_db_info()
-        if db_info["status"] == "connected":
-            logfire.info(
-                "Database connection successful",
-                url=db_info["url"],
-                port=settings.db_port,
-                status=db_info["status"],
-            )
-        else:
-            from sqlalchemy.exc import OperationalError
-
-            error_msg = db_info.get("error", "Connection check failed")
-            logfire.warning(
-                "Database connection check failed",
-                url=db_info["url"],
-                port=settings.db_port,
-                status=db_info["status"],
-                error=error_msg,
-            )
-            raise OperationalError(
-                statement=None, params=None, orig=Exception(error_msg)
-            )
-        return db_info
-
-    from database import retry_on_db_error_async
-
-    try:
-        db_info = await retry_on_db_error_async(check_db_with_logging)
-    except Exception as e:
-        logfire.error(
-            "Database connection failed after retries",
-            error=str(e),
-            port=settings.db_port,
-        )
-        db_info = None
+    # Independent startup checks run concurrently; blocking calls go to worker threads
+    db_info, supabase = await asyncio.gather(
+        _probe_db_with_retry(),
+        asyncio.to_thread(get_supabase_client_safe),
+    )
 
-    supabase = get_supabase_client_safe()
     if supabase:
         logfire.info("Supabase client initialized successfully")
     else:
@@ -82,35 +119,12 @@ async def lifespan(app: FastAPI):
             hint="Check SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY in .env file",
         )
 
-    logfire.info(
-        "CORS configuration",
-        allowed_origins=settings.allowed_origins,
-        origin_count=len(settings.allowed_origins),
-        environment=settings.environment,
-    )
+    _log_cors_configuration()
 
-    for origin in settings.allowed_origins:
-        if origin == "*":
-            if settings.is_production:
-                logfire.error(
-                    "SECURITY WARNING: Wildcard CORS origin in production",
-                    hint="Set ALLOWED_ORIGINS to specific domain in production"
-                )
-            continue
-
-        if not origin.startswith(("http://", "https://")):
-            logfire.error(
-                "Invalid CORS origin - missing protocol",
-                origin=origin,
-                hint=f"Should be 'https://{origin}' or 'http://{origin}'"
-            )
-
-        if origin.endswith("/"):
-            logfire.warning(
-                "CORS origin has trailing slash",
-                origin=origin,
-                hint="Remove trailing slash for exact matching"
-            )
+    if db_info is not None:
+        warmed = await asyncio.to_thread(warm_connection_pool, settings.db_pool_warm_size)
+        if warmed:
+            logfire.info("Database connection pool warmed", connections=warmed)
 
     logfire.info("Scribe API Server startup complete")
 
@@ -129,7 +143,7 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins,
+    allow_origins=frozenset(settings.allowed_origins),  # O(1) per-request origin lookup
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -139,7 +153,9 @@ app.add_middleware(
 @app.get("/health", tags=["Health"])
 async def health_check() -> Dict[str, str]:
     """Health check endpoint for load balancers and monitoring."""
-    db_connected = check_db_connection()
+    # Probed lazily: at most one DB round trip per TTL window, and only while
+    # /health is being polled. Runs in a worker thread to keep the loop free.
+    db_connected = await asyncio.to_thread(check_db_connection)
 
     return {
         "status": "healthy" if db_connected else "degraded",
@@ -150,6 +166,12 @@ async def health_check() -> Dict[str, str]:
     }
 
 
+@app.get("/health/db-pool", tags=["Health"])
+async def db_pool_status() -> Dict:
+    """Connection pool utilization for monitoring (issues no database queries)."""
+    return get_pool_status()
+
+
 if settings.is_development:
     @app.get("/debug/cors", tags=["Health"])
     async def debug_cors() -> Dict:
@@ -157,10 +179,10 @@ if settings.is_development:
         return {
             "allowed_origins": settings.allowed_origins,
             "origin_count": len(settings.allowed_origins),
-            "is_wildcard": "*" in settings.allowed_origins,
+            "is_wildcard": settings.has_wildcard_origin,
             "environment": settings.environment,
             "credentials_enabled": True,
-            "warning": "Wildcard origins violate CORS spec with credentials=True" if "*" in settings.allowed_origins else None,
+            "warning": "Wildcard origins violate CORS spec with credentials=True" if settings.has_wildcard_origin else None,
         }
 
 
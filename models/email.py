@@ -1,13 +1,12 @@
 """Email model for generated personalized emails."""
 
-from uuid import uuid4
-
 from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, Enum, Boolean, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from database.base import Base
+from utils.uuid_helpers import uuid7
 from pipeline.models.core import TemplateType
 
 class Email(Base):
@@ -19,7 +18,7 @@ class Email(Base):
     id = Column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,  # time-ordered: sequential btree inserts
         nullable=False,
         comment="Unique email ID"
     )
@@ -85,6 +84,7 @@ class Email(Base):
         Boolean,
         nullable=False,
         default=False,
+        server_default=text("false"),
         comment="Whether sufficient context was available for personalization"
     )
 
@@ -115,6 +115,11 @@ class Email(Base):
         Index('ix_emails_created_at', 'created_at', postgresql_using='btree'),
         Index('ix_emails_user_created', 'user_id', 'created_at'),
         Index('ix_emails_user_displayed', 'user_id', 'displayed'),
+        # History page: WHERE user_id = ? AND displayed ORDER BY created_at DESC
+        Index(
+            'ix_emails_user_displayed_created', 'user_id', 'created_at',
+            postgresql_where=text('displayed = true'),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -123,23 +128,3 @@ class Email(Base):
             f"<Email(id={self.id}, user_id={self.user_id}, "
             f"recipient='{self.recipient_name}', created_at={self.created_at})>"
         )
-
-    def to_dict(self) -> dict:
-        """
-        Convert email model to dictionary.
-
-        Returns:
-            dict: Email data as dictionary
-        """
-        return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "recipient_name": self.recipient_name,
-            "recipient_interest": self.recipient_interest,
-            "email_message": self.email_message,
-            "template_type": self.template_type.value if self.template_type else None,
-            "metadata": self.email_metadata or {},
-            "is_confident": self.is_confident,
-            "displayed": self.displayed,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
@@ -1,14 +1,14 @@
 """QueueItem model for database-backed email generation queue."""
 
 from enum import Enum
-from uuid import uuid4
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from database.base import Base
+from utils.uuid_helpers import uuid7
 
 
 class QueueStatus(str, Enum):
@@ -28,7 +28,7 @@ class QueueItem(Base):
     id = Column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,  # time-ordered: sequential btree inserts
         nullable=False,
         comment="Unique queue item ID"
     )
@@ -65,6 +65,7 @@ class QueueItem(Base):
         String(20),
         nullable=False,
         default=QueueStatus.PENDING,
+        server_default=text("'pending'"),
         comment="Current status: pending, processing, completed, failed"
     )
 
@@ -133,6 +134,11 @@ class QueueItem(Base):
         Index('ix_queue_items_status', 'status'),
         Index('ix_queue_items_created_at', 'created_at', postgresql_using='btree'),
         Index('ix_queue_items_user_status', 'user_id', 'status'),
+        # Queue positions: WHERE status = 'pending' ORDER BY created_at
+        Index(
+            'ix_queue_items_pending_created', 'created_at',
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -25,29 +25,38 @@ class LogfireConfig:
     _initialized = False
 
     @classmethod
-    def initialize(cls, token: Optional[str] = None) -> None:
+    def initialize(cls, token: Optional[str] = None, required: bool = False) -> None:
         """
         Initialize Logfire with project token.
 
         Args:
             token: Logfire project token (or set LOGFIRE_TOKEN env var)
+            required: Raise instead of degrading when no token is configured
 
         Note:
-            If Logfire is not available or token is missing, logs a warning
-            but allows the application to continue running.
+            Without a token (and required=False), Logfire is configured for
+            local use only so startup never blocks on observability.
         """
         if cls._initialized:
             return
 
         token = token or os.getenv("LOGFIRE_TOKEN")
-        if not token:
+        if not token and required:
             raise ValueError("LOGFIRE_TOKEN environment variable or token argument must be provided.")
 
-        logfire.configure(
-            token=token,
-            service_name="scribe-pipeline",
-            send_to_logfire=True,
-        )
+        if token:
+            logfire.configure(
+                token=token,
+                service_name="scribe-pipeline",
+                send_to_logfire=True,
+            )
+        else:
+            # Same degraded mode as the Celery worker: spans/logs stay local
+            logfire.configure(
+                service_name="scribe-pipeline",
+                send_to_logfire=False,
+            )
+            logfire.warning("LOGFIRE_TOKEN not set - Logfire export disabled")
 
         # Enable automatic instrumentation for pydantic-ai agents
         # This logs all LLM calls with inputs, outputs, tokens, cost, and latency
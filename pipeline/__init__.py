@@ -11,11 +11,11 @@ def create_email_pipeline() -> PipelineRunner:
     """
     Factory function to create a fully configured email generation pipeline.
 
-    Steps are registered in execution order:
+    Steps are registered with their dependencies:
     1. TemplateParser: Extract search terms from template
-    2. WebScraper: Fetch web content using search terms
-    3. ArxivHelper: Fetch academic papers (conditional on template_type)
-    4. EmailComposer: Generate final email and write to database
+    2. WebScraper: Fetch web content using search terms (after 1)
+    3. ArxivHelper: Fetch academic papers, conditional on template_type (after 1, concurrent with 2)
+    4. EmailComposer: Generate final email and write to database (after 2 and 3)
 
     Returns:
         PipelineRunner with all steps registered and ready to execute
@@ -56,9 +56,17 @@ def create_email_pipeline() -> PipelineRunner:
     from pipeline.steps.arxiv_helper.main import ArxivHelperStep
     from pipeline.steps.email_composer.main import EmailComposerStep
 
-    runner.register_step(TemplateParserStep())
-    runner.register_step(WebScraperStep())
-    runner.register_step(ArxivHelperStep())
-    runner.register_step(EmailComposerStep())
+    template_parser = TemplateParserStep()
+    web_scraper = WebScraperStep()
+    arxiv_helper = ArxivHelperStep()
+
+    runner.register_step(template_parser)
+    # WebScraper and ArxivHelper only read TemplateParser outputs, so they run concurrently
+    runner.register_step(web_scraper, depends_on=[template_parser.step_name])
+    runner.register_step(arxiv_helper, depends_on=[template_parser.step_name])
+    runner.register_step(
+        EmailComposerStep(),
+        depends_on=[web_scraper.step_name, arxiv_helper.step_name]
+    )
 
     return runner
@@ -2,16 +2,54 @@
 Core pipeline infrastructure - base classes for all steps.
 
 BasePipelineStep: Abstract base class for pipeline steps
-PipelineRunner: Orchestrates sequential step execution
+PipelineRunner: Orchestrates step execution in dependency order
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Callable, Awaitable, List
+from typing import Any, Optional, Callable, Awaitable, Dict, FrozenSet, Iterable, List, Set, Tuple
+import asyncio
+import copy
+import hashlib
+import json
 import time
 import logfire
 
 from pipeline.models.core import PipelineData, StepResult
-from pipeline.core.exceptions import StepExecutionError, ValidationError
+from pipeline.core.exceptions import PipelineExecutionError, StepExecutionError, ValidationError
+
+# Per-step latency distribution (cheaper to aggregate than querying spans)
+_step_duration_histogram = logfire.metric_histogram(
+    "pipeline.step.duration",
+    unit="s",
+    description="Duration of pipeline step executions that returned a result"
+)
+
+# Per-process step output cache. Each Celery task builds a fresh runner and
+# steps (their LLM clients are bound to that task's event loop), so cached
+# outputs live here at module level rather than on the step instances.
+# Entries are plain data, never clients. Keyed on step name + input hash.
+STEP_CACHE_MAX_ENTRIES = 256
+
+_step_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _get_cached_outputs(key: str, ttl_seconds: float) -> Dict[str, Any] | None:
+    """Return a copy of cached step outputs if present and not expired."""
+    entry = _step_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, outputs = entry
+    if time.monotonic() - stored_at > ttl_seconds:
+        _step_cache.pop(key, None)
+        return None
+    return copy.deepcopy(outputs)
+
+
+def _store_cached_outputs(key: str, outputs: Dict[str, Any]) -> None:
+    """Store step outputs, evicting the oldest entry when the cache is full."""
+    if key not in _step_cache and len(_step_cache) >= STEP_CACHE_MAX_ENTRIES:
+        _step_cache.pop(next(iter(_step_cache)))
+    _step_cache[key] = (time.monotonic(), copy.deepcopy(outputs))
 
 
 class BasePipelineStep(ABC):
@@ -27,8 +65,18 @@ class BasePipelineStep(ABC):
     - Error handling and logging
     - Timing metrics
     - Result validation
+    - Optional output caching (see cache_ttl_seconds)
+
+    Deterministic steps can opt into caching by setting cache_ttl_seconds and
+    listing the PipelineData fields they read (cache_input_fields) and write
+    (cache_output_fields). A repeat run with identical inputs restores the
+    outputs without calling _execute_step.
     """
 
+    cache_ttl_seconds: Optional[float] = None
+    cache_input_fields: Tuple[str, ...] = ()
+    cache_output_fields: Tuple[str, ...] = ()
+
     def __init__(self, step_name: str):
         """
         Initialize pipeline step.
@@ -38,6 +86,10 @@ class BasePipelineStep(ABC):
         """
         self.step_name = step_name
 
+        # Log/span names are fixed per step; build them once instead of per run
+        self._span_name = f"pipeline.{step_name}"
+        self._msg_failed = f"{step_name} failed"
+
     async def execute(
         self,
         pipeline_data: PipelineData,
@@ -62,19 +114,14 @@ class BasePipelineStep(ABC):
         """
         start_time = time.perf_counter()
 
-        # Create Logfire span for this step
+        # One span per step; its start/end timestamps replace separate
+        # started/completed log events, and outcomes are span attributes
         with logfire.span(
-            f"pipeline.{self.step_name}",
+            self._span_name,
             task_id=pipeline_data.task_id,
             step=self.step_name
-        ):
+        ) as span:
             try:
-                # Log step start
-                logfire.info(
-                    f"{self.step_name} started",
-                    task_id=pipeline_data.task_id
-                )
-
                 # Notify progress callback (if provided)
                 if progress_callback:
                     await progress_callback(self.step_name, "started")
@@ -84,8 +131,34 @@ class BasePipelineStep(ABC):
                 if validation_error:
                     raise ValidationError(f"Input validation failed: {validation_error}")
 
-                # Execute the step-specific logic
-                result = await self._execute_step(pipeline_data)
+                cache_key = self._cache_key(pipeline_data)
+                cached = (
+                    _get_cached_outputs(cache_key, self.cache_ttl_seconds)
+                    if cache_key else None
+                )
+
+                if cached is not None:
+                    cached_metadata = cached.pop("__metadata__")
+                    for name, value in cached.items():
+                        setattr(pipeline_data, name, value)
+                    span.set_attribute("cache_hit", True)
+                    result = StepResult(
+                        success=True,
+                        step_name=self.step_name,
+                        metadata={**cached_metadata, "cache_hit": True}
+                    )
+                else:
+                    # Execute the step-specific logic
+                    result = await self._execute_step(pipeline_data)
+
+                    # Only clean successes are cached; warnings usually mean degraded output
+                    if cache_key and result.success and not result.warnings:
+                        outputs = {
+                            name: getattr(pipeline_data, name)
+                            for name in self.cache_output_fields
+                        }
+                        outputs["__metadata__"] = result.metadata or {}
+                        _store_cached_outputs(cache_key, outputs)
 
                 # Calculate duration
                 duration = time.perf_counter() - start_time
@@ -96,13 +169,9 @@ class BasePipelineStep(ABC):
                     result.metadata = {}
                 result.metadata["duration"] = duration
 
-                # Log success
-                logfire.info(
-                    f"{self.step_name} completed",
-                    task_id=pipeline_data.task_id,
-                    duration=duration,
-                    success=result.success
-                )
+                span.set_attribute("duration", duration)
+                span.set_attribute("success", result.success)
+                _step_duration_histogram.record(duration, {"step": self.step_name})
 
                 # Notify progress callback
                 if progress_callback:
@@ -115,18 +184,19 @@ class BasePipelineStep(ABC):
                 # Calculate duration even on failure
                 duration = time.perf_counter() - start_time
 
-                # Log error with full context
+                # Lightweight record only: the re-raised StepExecutionError
+                # leaves this step's span with the exception and its traceback
+                error_message = str(e)
                 logfire.error(
-                    f"{self.step_name} failed",
+                    self._msg_failed,
                     task_id=pipeline_data.task_id,
-                    error=str(e),
+                    error=error_message,
                     error_type=type(e).__name__,
-                    duration=duration,
-                    exc_info=True  # Include stack trace
+                    duration=duration
                 )
 
                 # Record error in pipeline data
-                pipeline_data.add_error(self.step_name, str(e))
+                pipeline_data.add_error(self.step_name, error_message)
 
                 # Notify progress callback
                 if progress_callback:
@@ -135,6 +205,40 @@ class BasePipelineStep(ABC):
                 # Wrap exception for clarity
                 raise StepExecutionError(self.step_name, e) from e
 
+    def should_run(self, pipeline_data: PipelineData) -> bool:
+        """
+        Decide whether the runner should execute this step at all.
+
+        Override for conditional steps. Returning False skips execute()
+        entirely (no span, validation, timing or progress callback); the
+        step's PipelineData outputs keep their defaults.
+
+        Args:
+            pipeline_data: Shared data object, with upstream outputs populated
+
+        Returns:
+            True to execute the step (default), False to skip it
+        """
+        return True
+
+    def _cache_key(self, pipeline_data: PipelineData) -> Optional[str]:
+        """
+        Build the cache key for this step's inputs.
+
+        Returns:
+            Hex digest of step name + canonical JSON of cache_input_fields,
+            or None if caching is disabled for this step
+        """
+        if not self.cache_ttl_seconds or not self.cache_output_fields:
+            return None
+
+        payload = json.dumps(
+            [self.step_name] + [getattr(pipeline_data, name) for name in self.cache_input_fields],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
     async def _validate_input(self, pipeline_data: PipelineData) -> Optional[str]:
         """
         Validate that prerequisites for this step are met.
@@ -171,11 +275,12 @@ class BasePipelineStep(ABC):
 
 class PipelineRunner:
     """
-    Orchestrates sequential execution of all pipeline steps.
+    Orchestrates execution of all pipeline steps in dependency order.
 
     Responsibilities:
-    - Register steps in execution order
-    - Execute steps sequentially
+    - Register steps and the steps they depend on
+    - Execute steps as soon as their dependencies complete; independent
+      steps run concurrently (e.g. web scraping and ArXiv lookup)
     - Handle step failures
     - Track overall progress
     - Return final result (email_id)
@@ -186,20 +291,45 @@ class PipelineRunner:
         Initialize pipeline runner.
 
         Args:
-            steps: Optional list of steps (if None, use default factory)
+            steps: Optional list of steps, registered sequentially (each depends on the previous)
         """
-        self.steps = steps or []
+        self.steps: List[BasePipelineStep] = []
+        self.dependencies: Dict[str, FrozenSet[str]] = {}
+        self._progress_table: Optional[Tuple[int, ...]] = None
+        for step in steps or []:
+            self.register_step(step)
 
-    def register_step(self, step: BasePipelineStep) -> None:
+    def register_step(
+        self,
+        step: BasePipelineStep,
+        depends_on: Optional[Iterable[str]] = None
+    ) -> None:
         """
         Add a step to the pipeline.
 
-        Steps execute in the order they are registered.
-
         Args:
             step: Pipeline step to add
+            depends_on: Names of steps whose outputs this step reads. Defaults to
+                        the previously registered step, i.e. sequential execution.
+                        Dependencies must already be registered, so the graph
+                        is always acyclic.
+
+        Raises:
+            ValueError: If a dependency has not been registered
         """
+        if depends_on is None:
+            depends_on = [self.steps[-1].step_name] if self.steps else []
+        dependencies = frozenset(depends_on)
+
+        unknown = dependencies - self.dependencies.keys()
+        if unknown:
+            raise ValueError(
+                f"Step '{step.step_name}' depends on unregistered steps: {sorted(unknown)}"
+            )
+
         self.steps.append(step)
+        self.dependencies[step.step_name] = dependencies
+        self._progress_table = None
 
     async def run(
         self,
@@ -207,7 +337,10 @@ class PipelineRunner:
         progress_callback: Optional[Callable[[str, str], Awaitable[None]]] = None
     ) -> str:
         """
-        Run all pipeline steps sequentially.
+        Run all pipeline steps, overlapping steps that don't depend on each other.
+
+        Concurrent steps write disjoint PipelineData fields, and the shared
+        helpers (add_timing/add_error) run on the single event loop thread.
 
         Args:
             pipeline_data: Shared data object
@@ -227,31 +360,70 @@ class PipelineRunner:
             user_id=pipeline_data.user_id,
             template_type=pipeline_data.template_type.value if pipeline_data.template_type else None
         ):
+            total_steps = len(self.steps)
+            if self._progress_table is None:
+                # Progress % after the Nth step starts; rebuilt only when steps change
+                self._progress_table = tuple(
+                    int((n / total_steps) * 100) for n in range(1, total_steps + 1)
+                )
+            progress_table = self._progress_table
             logfire.info(
                 "Pipeline execution started",
                 task_id=pipeline_data.task_id,
-                total_steps=len(self.steps)
+                total_steps=total_steps
             )
 
-            # Execute each step sequentially
-            for i, step in enumerate(self.steps):
-                # Log progress
-                progress_pct = int(((i + 1) / len(self.steps)) * 100)
-                logfire.info(
-                    f"Executing step {i+1}/{len(self.steps)}",
-                    step=step.step_name,
-                    progress_pct=progress_pct
-                )
+            completed: Set[str] = set()
+            pending = list(self.steps)
+            started = 0
+
+            while pending:
+                # Registration order guarantees at least one step is ready
+                ready = [s for s in pending if self.dependencies[s.step_name] <= completed]
+                pending = [s for s in pending if s not in ready]
+
+                runnable: List[BasePipelineStep] = []
+                for step in ready:
+                    started += 1
+                    if not step.should_run(pipeline_data):
+                        # Skipped steps count as done so their dependents can proceed
+                        logfire.info(
+                            "Skipping step {step_number}/{total_steps}",
+                            step_number=started,
+                            total_steps=total_steps,
+                            step=step.step_name
+                        )
+                        completed.add(step.step_name)
+                        continue
+
+                    # Logfire fills the template from kwargs, so no per-call formatting
+                    logfire.info(
+                        "Executing step {step_number}/{total_steps}",
+                        step_number=started,
+                        total_steps=total_steps,
+                        step=step.step_name,
+                        progress_pct=progress_table[started - 1]
+                    )
+                    runnable.append(step)
+
+                if not runnable:
+                    continue
+                if len(runnable) == 1:
+                    results = [await runnable[0].execute(pipeline_data, progress_callback)]
+                else:
+                    # Let every concurrent step finish, then surface the first failure in order
+                    results = await asyncio.gather(
+                        *(step.execute(pipeline_data, progress_callback) for step in runnable),
+                        return_exceptions=True
+                    )
 
-                # Execute step
-                result = await step.execute(pipeline_data, progress_callback)
+                for step, result in zip(runnable, results):
+                    if isinstance(result, BaseException):
+                        raise result
 
-                # Check for failure
-                if not result.success:
-                    raise StepExecutionError(
-                        step.step_name,
-                        Exception(result.error or "Unknown error")
-                    )
+                    if not result.success:
+                        self._handle_step_failure(step, result, pipeline_data)
+                    completed.add(step.step_name)
 
             # Verify email_id was set by final step
             email_id = pipeline_data.metadata.get("email_id")
@@ -272,3 +444,28 @@ class PipelineRunner:
             )
 
             return email_id
+
+    def _handle_step_failure(
+        self,
+        step: BasePipelineStep,
+        result: StepResult,
+        pipeline_data: PipelineData
+    ) -> None:
+        """
+        Record and raise a step that returned success=False.
+
+        Returned failures never went through execute()'s except block, so this
+        is the single place they are logged and added to pipeline_data.errors.
+
+        Raises:
+            StepExecutionError: Always, carrying the step's error message
+        """
+        error = result.error or "Unknown error"
+        pipeline_data.add_error(step.step_name, error)
+        logfire.error(
+            "Step returned failure",
+            task_id=pipeline_data.task_id,
+            step=step.step_name,
+            error=error
+        )
+        raise StepExecutionError(step.step_name, PipelineExecutionError(error)) from None
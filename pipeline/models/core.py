@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional, List
-from datetime import datetime
+import time
 
 
 class JobStatus(Enum):
@@ -21,7 +21,7 @@ class TemplateType(str, Enum):
     GENERAL = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineData:
     """
     In-memory state passed between pipeline steps. Not persisted to database.
@@ -118,8 +118,8 @@ class PipelineData:
     """
 
     # Transient data (logged to Logfire, not persisted)
-    started_at: datetime = field(default_factory=datetime.utcnow)
-    """Pipeline start time"""
+    started_at: float = field(default_factory=time.perf_counter)
+    """Pipeline start (time.perf_counter() stamp, same clock as step timings)"""
 
     step_timings: Dict[str, float] = field(default_factory=dict)
     """
@@ -139,7 +139,7 @@ class PipelineData:
 
     def total_duration(self) -> float:
         """Calculate total pipeline execution time in seconds"""
-        return (datetime.utcnow() - self.started_at).total_seconds()
+        return time.perf_counter() - self.started_at
 
     def add_timing(self, step_name: str, duration: float) -> None:
         """Record step timing"""
@@ -149,12 +149,18 @@ class PipelineData:
         """Record non-fatal error"""
         self.errors.append(f"{step_name}: {error_message}")
 
+    def release_intermediates(self) -> None:
+        """Drop scraped/ArXiv context once the email is composed (largest fields)"""
+        self.scraped_content = ""
+        self.scraped_page_contents = {}
+        self.arxiv_papers = []
+
 
 # ===================================================================
 # STEP RESULT
 # ===================================================================
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """
     Result of a pipeline step execution.
@@ -15,6 +15,10 @@ class ArxivHelperStep(BasePipelineStep):
     def __init__(self):
         super().__init__(step_name="arxiv_helper")
 
+    def should_run(self, pipeline_data: PipelineData) -> bool:
+        """Only RESEARCH templates need papers; the runner skips this step otherwise."""
+        return pipeline_data.template_type == TemplateType.RESEARCH
+
     async def _validate_input(self, pipeline_data: PipelineData) -> Optional[str]:
         """Validate template_type, recipient_name, and recipient_interest from Step 1."""
         if not pipeline_data.template_type:
@@ -31,7 +35,7 @@ class ArxivHelperStep(BasePipelineStep):
     async def _execute_step(self, pipeline_data: PipelineData) -> StepResult:
         """Search ArXiv for papers if RESEARCH template, otherwise skip."""
         try:
-            # Step 1: Check template type
+            # Step 1: Check template type (direct calls; the runner uses should_run)
             if pipeline_data.template_type != TemplateType.RESEARCH:
                 logfire.info(
                     "Skipping ArXiv search - not RESEARCH template",
@@ -84,10 +88,12 @@ class ArxivHelperStep(BasePipelineStep):
                 )
 
             # Step 3: Update PipelineData with papers
+            # Built once and shared by the log event and result metadata
+            top_titles = [p.title for p in papers[:3]]
             logfire.info(
                 "ArXiv papers found",
                 total_papers=len(papers),
-                paper_titles=[p.title for p in papers[:3]]
+                paper_titles=top_titles
             )
 
             pipeline_data.arxiv_papers = [
@@ -106,7 +112,7 @@ class ArxivHelperStep(BasePipelineStep):
                 step_name=self.step_name,
                 metadata={
                     "papers_found": len(papers),
-                    "paper_titles": [p.title for p in papers[:3]]
+                    "paper_titles": top_titles
                 }
             )
 
@@ -1,48 +1,80 @@
 """
 ArXiv Helper Step Models
 
-Pydantic models for academic paper data.
+Data models for academic paper data.
 """
 
+from dataclasses import dataclass
 from typing import List
-from pydantic import BaseModel, Field
 from datetime import datetime
 
+import arxiv
 
-class ArxivPaper(BaseModel):
-    """Single academic paper from ArXiv."""
+# ArXiv caps abstracts well below this; anything longer is not a real abstract
+MAX_ABSTRACT_LENGTH = 5000
 
-    title: str = Field(description="Paper title")
 
-    abstract: str = Field(
-        description="Paper abstract",
-        max_length=5000
-    )
+@dataclass(slots=True)
+class ArxivPaper:
+    """
+    Single academic paper from ArXiv.
 
-    authors: List[str] = Field(
-        description="List of author names",
-        min_length=1
-    )
+    A plain slotted dataclass rather than a Pydantic model: papers are built
+    from the arxiv client's already-typed results, so the only checks needed
+    run once in from_result() instead of per-field validation.
+    """
 
-    published_date: datetime = Field(
-        description="Publication date"
-    )
+    title: str
+    """Paper title"""
 
-    arxiv_id: str = Field(
-        description="ArXiv paper ID (e.g., '2301.12345')"
-    )
+    abstract: str
+    """Paper abstract (at most MAX_ABSTRACT_LENGTH characters)"""
 
-    arxiv_url: str = Field(
-        description="ArXiv paper URL"
-    )
+    authors: List[str]
+    """List of author names (at least one)"""
 
-    pdf_url: str = Field(
-        description="Direct PDF link"
-    )
+    published_date: datetime
+    """Publication date"""
 
-    primary_category: str = Field(
-        description="Primary ArXiv category (e.g., 'cs.AI')"
-    )
+    arxiv_id: str
+    """ArXiv paper ID (e.g., '2301.12345')"""
+
+    arxiv_url: str
+    """ArXiv paper URL"""
+
+    pdf_url: str
+    """Direct PDF link"""
+
+    primary_category: str
+    """Primary ArXiv category (e.g., 'cs.AI')"""
+
+    @classmethod
+    def from_result(cls, result: arxiv.Result) -> "ArxivPaper":
+        """
+        Build a paper from an arxiv client result.
+
+        Raises:
+            ValueError: If the result has no authors or an oversized abstract
+        """
+        authors = [author.name for author in result.authors]
+        if not authors:
+            raise ValueError(f"ArXiv result {result.entry_id} has no authors")
+
+        if len(result.summary) > MAX_ABSTRACT_LENGTH:
+            raise ValueError(
+                f"ArXiv result {result.entry_id} abstract exceeds {MAX_ABSTRACT_LENGTH} characters"
+            )
+
+        return cls(
+            title=result.title,
+            abstract=result.summary,
+            authors=authors,
+            published_date=result.published,
+            arxiv_id=result.entry_id.split('/')[-1],  # Extract ID
+            arxiv_url=result.entry_id,
+            pdf_url=result.pdf_url,
+            primary_category=result.primary_category
+        )
 
     @property
     def year(self) -> int:
@@ -63,4 +95,4 @@ class ArxivPaper(BaseModel):
             "published_date": self.published_date.isoformat(),
             "year": self.year,
             "arxiv_url": self.arxiv_url
-        }
\ No newline at end of file
+        }
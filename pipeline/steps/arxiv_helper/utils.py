@@ -5,9 +5,11 @@ ArXiv API utilities for paper search.
 """
 
 import asyncio
+import time
 import arxiv
 import logfire
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 from .models import ArxivPaper
 from datetime import datetime
@@ -20,6 +22,36 @@ INITIAL_FETCH_COUNT = 15        # Fetch more papers for filtering
 MIN_YEAR_THRESHOLD = 10          # Only include papers from last 10 years
 MAX_FINAL_RESULTS = 5           # Return top 5 after filtering
 
+# Per-process result cache (repeat recipients skip the rate-limited ArXiv API)
+SEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+SEARCH_CACHE_MAX_ENTRIES = 512
+
+_search_cache: Dict[Tuple[str, int, str], Tuple[float, List[ArxivPaper]]] = {}
+
+
+def _cache_key(author_name: str, max_results: int, sort_by: arxiv.SortCriterion) -> Tuple[str, int, str]:
+    """Normalize author name so casing/whitespace variants share one entry."""
+    return (" ".join(author_name.split()).casefold(), max_results, sort_by.value)
+
+
+def _get_cached_search(key: Tuple[str, int, str]) -> List[ArxivPaper] | None:
+    """Return cached papers if present and not expired."""
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, papers = entry
+    if time.monotonic() - stored_at > SEARCH_CACHE_TTL_SECONDS:
+        _search_cache.pop(key, None)
+        return None
+    return list(papers)
+
+
+def _store_cached_search(key: Tuple[str, int, str], papers: List[ArxivPaper]) -> None:
+    """Store papers, evicting the oldest entry when the cache is full."""
+    if key not in _search_cache and len(_search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+        _search_cache.pop(next(iter(_search_cache)))
+    _search_cache[key] = (time.monotonic(), list(papers))
+
 
 def _filter_recent_papers(papers: List[ArxivPaper]) -> List[ArxivPaper]:
     """
@@ -45,6 +77,22 @@ def _filter_recent_papers(papers: List[ArxivPaper]) -> List[ArxivPaper]:
     # Return top 5 after filtering
     return recent_papers[:MAX_FINAL_RESULTS]
 
+@lru_cache(maxsize=None)
+def _get_arxiv_client(page_size: int) -> arxiv.Client:
+    """
+    Return a shared ArXiv client for the given page size.
+
+    Reusing the client keeps its underlying requests.Session (and its
+    keep-alive connections) alive across searches, and makes the 4s
+    rate limit apply process-wide instead of per search.
+    """
+    return arxiv.Client(
+        page_size=page_size,        # Fetch max_results per page (efficient)
+        delay_seconds=4,            # Rate limiting: 4s between requests (ArXiv recommends ~3s)
+        num_retries=2
+    )
+
+
 def _search_arxiv_sync(
     author_name: str,
     max_results: int,
@@ -68,11 +116,7 @@ def _search_arxiv_sync(
     query = f'au:"{author_name}"'
 
     try:
-        client = arxiv.Client(
-            page_size=max_results,      # Fetch max_results per page (efficient)
-            delay_seconds=4,            # Rate limiting: 4s between requests (ArXiv recommends ~3s)
-            num_retries=2 
-        )
+        client = _get_arxiv_client(max_results)
 
         search = arxiv.Search(
             query=query,
@@ -83,18 +127,7 @@ def _search_arxiv_sync(
         papers = []
 
         for result in client.results(search):
-            paper = ArxivPaper(
-                title=result.title,
-                abstract=result.summary,
-                authors=[author.name for author in result.authors],
-                published_date=result.published,
-                arxiv_id=result.entry_id.split('/')[-1],  # Extract ID
-                arxiv_url=result.entry_id,
-                pdf_url=result.pdf_url,
-                primary_category=result.primary_category
-            )
-
-            papers.append(paper)
+            papers.append(ArxivPaper.from_result(result))
 
         # Filter to recent papers (last 7 years) and limit to top 5
         filtered_papers = _filter_recent_papers(papers)
@@ -130,6 +163,16 @@ async def search_arxiv(
     """
     query = f'au:"{author_name}"'
 
+    cache_key = _cache_key(author_name, max_results, sort_by)
+    cached = _get_cached_search(cache_key)
+    if cached is not None:
+        logfire.info(
+            "ArXiv search served from cache",
+            query=query,
+            papers_returned=len(cached)
+        )
+        return cached
+
     logfire.info(
         "Starting ArXiv search with timeout protection",
         query=query,
@@ -149,6 +192,9 @@ async def search_arxiv(
             timeout=timeout
         )
 
+        # Only successful searches are cached; timeouts/errors retry next time
+        _store_cached_search(cache_key, papers)
+
         logfire.info(
             "ArXiv search completed successfully (after filtering)",
             papers_returned=len(papers),
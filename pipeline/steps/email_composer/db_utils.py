@@ -9,6 +9,7 @@ from typing import Optional
 from uuid import UUID
 
 import logfire
+from sqlalchemy import func, update
 
 from models.email import Email
 from models.user import User
@@ -90,24 +91,27 @@ async def increment_user_generation_count(user_id: UUID) -> bool:
     def _sync_increment() -> bool:
         """Synchronous database operation executed in thread pool."""
         with get_db_context() as db:
-            # Fetch user
-            user = db.query(User).filter(User.id == user_id).first()
-
-            if not user:
+            # Atomic single-statement increment (no read-modify-write race, one round-trip)
+            new_count = db.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(generation_count=func.coalesce(User.generation_count, 0) + 1)
+                .returning(User.generation_count)
+            ).scalar_one_or_none()
+
+            if new_count is None:
                 logfire.warning(
                     "User not found for generation count increment",
                     user_id=str(user_id)
                 )
                 return False
 
-            # Increment count
-            user.generation_count = (user.generation_count or 0) + 1
             db.commit()  # Explicit commit
 
             logfire.info(
                 "User generation count incremented",
                 user_id=str(user_id),
-                new_count=user.generation_count
+                new_count=new_count
             )
 
             return True
@@ -2,17 +2,25 @@
 
 import json
 import logfire
-from typing import Optional
+from typing import Optional, Tuple
 
 from config.settings import settings
 from pipeline.core.runner import BasePipelineStep
 from pipeline.models.core import PipelineData, StepResult, TemplateType
+from pipeline.steps.template_parser.utils import PLACEHOLDER_PATTERN
 from utils.llm_agent import create_agent
 
 from .models import ComposedEmail
 from .prompts import SYSTEM_PROMPT, create_composition_prompt
 from .db_utils import write_email_to_db, increment_user_generation_count
 
+# How often the primary model's output is unusable and the fallback model runs
+_fallback_counter = logfire.metric_counter(
+    "pipeline.email_composer.fallback",
+    unit="1",
+    description="Email compositions retried with the fallback model"
+)
+
 
 class EmailComposerStep(BasePipelineStep):
     """Generate final email with Claude and write to database."""
@@ -28,8 +36,20 @@ class EmailComposerStep(BasePipelineStep):
 
         # Create pydantic-ai agent for email composition
         # Optimized for Kimi K2p5's literal interpretation and structured output strengths
-        self.composition_agent = create_agent(
-            model=self.model,
+        self.composition_agent = self._create_composition_agent(self.model)
+
+        # Stronger model, only invoked when the primary output fails validation
+        # (EMAIL_COMPOSER_FALLBACK_MODEL; set it empty to disable)
+        self.fallback_model = settings.email_composer_fallback_model or None
+        self.fallback_agent = (
+            self._create_composition_agent(self.fallback_model)
+            if self.fallback_model else None
+        )
+
+    def _create_composition_agent(self, model: str):
+        """Create a composition agent with the step's shared generation settings."""
+        return create_agent(
+            model=model,
             system_prompt=SYSTEM_PROMPT,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
@@ -59,6 +79,56 @@ class EmailComposerStep(BasePipelineStep):
 
         return None
 
+    async def _generate(self, agent, user_prompt: str) -> Tuple[str, bool, bool]:
+        """Run agent and parse its JSON reply into (email_text, is_confident, is_valid)."""
+        result = await agent.run(user_prompt)
+        response_text = result.output.strip()
+
+        # Parse JSON response
+        try:
+            parsed = json.loads(response_text)
+            email_text = parsed["email"]
+            is_confident = parsed.get("is_confident", False)
+        except (json.JSONDecodeError, KeyError) as e:
+            logfire.warning(
+                "Failed to parse JSON response, falling back to plain text",
+                error=str(e),
+                response_preview=response_text[:200]
+            )
+            # Fallback: treat entire response as email text
+            return response_text, False, False
+
+        if not email_text.strip() or PLACEHOLDER_PATTERN.search(email_text):
+            logfire.warning("Composed email is empty or has unfilled placeholders")
+            return email_text, is_confident, False
+
+        return email_text, is_confident, True
+
+    async def _compose(self, user_prompt: str) -> Tuple[str, bool, str, bool]:
+        """
+        Generate the email, retrying once with the fallback model if the primary output is unusable.
+
+        Returns:
+            (email_text, is_confident, model_used, fallback_used)
+        """
+        email_text, is_confident, is_valid = await self._generate(
+            self.composition_agent, user_prompt
+        )
+        if is_valid or self.fallback_agent is None:
+            return email_text, is_confident, self.model, False
+
+        logfire.warning(
+            "Primary model output failed validation, retrying with fallback model",
+            model=self.model,
+            fallback_model=self.fallback_model
+        )
+        _fallback_counter.add(1, {"model": self.model, "fallback_model": self.fallback_model})
+
+        email_text, is_confident, _ = await self._generate(
+            self.fallback_agent, user_prompt
+        )
+        return email_text, is_confident, self.fallback_model, True
+
     async def _execute_step(self, pipeline_data: PipelineData) -> StepResult:
         """Generate email with Claude, write to database, and update PipelineData."""
         try:
@@ -79,24 +149,9 @@ class EmailComposerStep(BasePipelineStep):
                 recipient_name=pipeline_data.recipient_name
             )
 
-            # Step 2: Generate email via LLM (agent handles retries internally)
-            result = await self.composition_agent.run(user_prompt)
-            response_text = result.output.strip()
-
-            # Parse JSON response
-            try:
-                parsed = json.loads(response_text)
-                email_text = parsed["email"]
-                is_confident = parsed.get("is_confident", False)
-            except (json.JSONDecodeError, KeyError) as e:
-                logfire.warning(
-                    "Failed to parse JSON response, falling back to plain text",
-                    error=str(e),
-                    response_preview=response_text[:200]
-                )
-                # Fallback: treat entire response as email text
-                email_text = response_text
-                is_confident = False
+            # Step 2: Generate email via LLM (agent handles retries internally;
+            # an unusable reply is retried once on the fallback model)
+            email_text, is_confident, model_used, fallback_used = await self._compose(user_prompt)
 
             logfire.info(
                 "Email generated successfully",
@@ -110,7 +165,8 @@ class EmailComposerStep(BasePipelineStep):
                 email_content=email_text,
                 is_confident=is_confident,
                 generation_metadata={
-                    "model": self.model,
+                    "model": model_used,
+                    "fallback_used": fallback_used,
                 },
             )
 
@@ -131,7 +187,7 @@ class EmailComposerStep(BasePipelineStep):
                 ],
                 "step_timings": pipeline_data.step_timings,
                 "generation_metadata": composed_email.generation_metadata,
-                "model": self.model,
+                "model": model_used,
                 "temperature": self.temperature
             }
 
@@ -169,7 +225,7 @@ class EmailComposerStep(BasePipelineStep):
             pipeline_data.composition_metadata = {
                 "email_id": str(email_id),
                 "word_count": len(composed_email.email_content.split()),
-                "model": self.model,
+                "model": model_used,
                 "temperature": self.temperature,
                 "is_confident": composed_email.is_confident,
                 **composed_email.generation_metadata
@@ -122,12 +122,14 @@ def create_composition_prompt(
     arxiv_section = "NOT AVAILABLE - No ArXiv papers found or not a RESEARCH template."
 
     if arxiv_papers:
-        arxiv_section = "=== ARXIV PAPERS ===\n"
-        for i, paper in enumerate(arxiv_papers[:5], 1):
-            arxiv_section += f"\n{i}. Title: {paper['title']}\n"
-            arxiv_section += f"   Authors: {', '.join(paper['authors'][:3])}\n"
-            arxiv_section += f"   Year: {paper['year']}\n"
-            arxiv_section += f"   Abstract: {paper['abstract']}\n"
+        # Single join instead of repeated += (abstracts make each piece large)
+        arxiv_section = "=== ARXIV PAPERS ===\n" + "".join(
+            f"\n{i}. Title: {paper['title']}\n"
+            f"   Authors: {', '.join(paper['authors'][:3])}\n"
+            f"   Year: {paper['year']}\n"
+            f"   Abstract: {paper['abstract']}\n"
+            for i, paper in enumerate(arxiv_papers[:5], 1)
+        )
 
     # Build prompt with XML structure
     prompt = f"""<task>
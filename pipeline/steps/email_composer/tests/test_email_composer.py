@@ -15,7 +15,6 @@ Run with:
 import pytest
 import logfire
 from uuid import uuid4, UUID
-from datetime import datetime
 
 from pipeline.steps.email_composer.main import EmailComposerStep
 from pipeline.models.core import PipelineData, TemplateType
@@ -177,8 +176,7 @@ def create_realistic_pipeline_data_research(
         user_id=str(user_id),
         email_template=email_template,
         recipient_name=recipient_name,
-        recipient_interest=recipient_interest,
-        started_at=datetime.utcnow()
+        recipient_interest=recipient_interest
     )
 
     # ===================================================================
@@ -0,0 +1,75 @@
+"""
+Unit tests for the Email Composer fallback model.
+
+Agents are replaced with in-memory fakes (via create_agent), so no LLM API
+key or database is required.
+
+Run with:
+    pytest pipeline/steps/email_composer/tests/test_fallback.py -v
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from config.settings import get_settings
+from pipeline.steps.email_composer import main as composer_main
+from pipeline.steps.email_composer.main import EmailComposerStep
+
+
+class _FakeAgent:
+    """Returns a canned JSON reply and records the prompts it was run with."""
+
+    def __init__(self, email: str):
+        self.email = email
+        self.prompts: List[str] = []
+
+    async def run(self, user_prompt: str):
+        self.prompts.append(user_prompt)
+        return SimpleNamespace(output=json.dumps({"email": self.email, "is_confident": True}))
+
+
+def _composer(monkeypatch, replies: Dict[str, str], fallback_model: str) -> EmailComposerStep:
+    """Build the step with fake agents keyed by model name."""
+    agents = {model: _FakeAgent(email) for model, email in replies.items()}
+    monkeypatch.setattr(get_settings(), "email_composer_model", "primary-model")
+    monkeypatch.setattr(get_settings(), "email_composer_fallback_model", fallback_model)
+    monkeypatch.setattr(composer_main, "create_agent", lambda model, **_: agents[model])
+    return EmailComposerStep()
+
+
+@pytest.mark.unit
+async def test_fallback_used_when_primary_leaves_placeholders(monkeypatch):
+    """Primary output with an unfilled {{placeholder}} is replaced by the fallback's email."""
+    counted = []
+    monkeypatch.setattr(composer_main._fallback_counter, "add", lambda amount, attrs: counted.append(attrs))
+    step = _composer(monkeypatch, {
+        "primary-model": "Hi Dr. Smith, I loved {{research}}.",
+        "fallback-model": "Hi Dr. Smith, I loved your paper on robust RL.",
+    }, fallback_model="fallback-model")
+
+    email_text, is_confident, model_used, fallback_used = await step._compose("prompt")
+
+    assert email_text == "Hi Dr. Smith, I loved your paper on robust RL."
+    assert model_used == "fallback-model"
+    assert fallback_used is True
+    assert is_confident is True
+    assert step.fallback_agent.prompts == ["prompt"]
+    assert counted == [{"model": "primary-model", "fallback_model": "fallback-model"}]
+
+
+@pytest.mark.unit
+async def test_valid_primary_output_skips_fallback(monkeypatch):
+    """A clean primary reply is used as-is and the fallback model is never called."""
+    step = _composer(monkeypatch, {
+        "primary-model": "Hi Dr. Smith, I loved your paper on robust RL.",
+        "fallback-model": "unused",
+    }, fallback_model="fallback-model")
+
+    _, _, model_used, fallback_used = await step._compose("prompt")
+
+    assert model_used == "primary-model"
+    assert fallback_used is False
+    assert step.fallback_agent.prompts == []
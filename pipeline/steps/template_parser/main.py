@@ -17,6 +17,11 @@ from .utils import extract_placeholders
 class TemplateParserStep(BasePipelineStep):
     """Parse template using Claude to extract search terms and classify type."""
 
+    # Identical template + recipient inputs reuse the previous analysis
+    cache_ttl_seconds = 60 * 60
+    cache_input_fields = ("email_template", "recipient_name", "recipient_interest")
+    cache_output_fields = ("search_terms", "template_type", "template_analysis")
+
     def __init__(self):
         super().__init__(step_name="template_parser")
 
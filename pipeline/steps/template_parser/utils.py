@@ -7,6 +7,9 @@ Helper functions for placeholder extraction and template analysis.
 import re
 from typing import List
 
+# Match {{variable}} pattern
+PLACEHOLDER_PATTERN = re.compile(r'\{\{[^}]+\}\}')
+
 
 def extract_placeholders(template: str) -> List[str]:
     """
@@ -22,16 +25,9 @@ def extract_placeholders(template: str) -> List[str]:
         >>> extract_placeholders("Hi {{name}}, I loved {{research}}!")
         ['{{name}}', '{{research}}']
     """
-    # Match {{variable}} pattern
-    pattern = r'\{\{[^}]+\}\}'
-    matches = re.findall(pattern, template)
+    # Cheap substring scan first; most templates without braces skip the regex
+    if '{{' not in template:
+        return []
 
     # Return unique placeholders in order of appearance
-    seen = set()
-    unique_matches = []
-    for match in matches:
-        if match not in seen:
-            seen.add(match)
-            unique_matches.append(match)
-
-    return unique_matches
\ No newline at end of file
+    return list(dict.fromkeys(PLACEHOLDER_PATTERN.findall(template)))
\ No newline at end of file
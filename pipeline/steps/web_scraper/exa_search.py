@@ -1,8 +1,12 @@
 """Exa Search API integration for unified search + synthesis."""
 
 import asyncio
+import random
+import re
 import logfire
+import requests
 from typing import List, Optional
+from urllib.parse import urlsplit, urlunsplit
 from pydantic import BaseModel, Field
 from exa_py import Exa
 from config.settings import settings
@@ -29,6 +33,29 @@ class DualQueryResult(BaseModel):
     all_citations: List[ExaCitation] = Field(default_factory=list)
 
 
+def _normalize_url(url: str) -> str:
+    """Canonical form for dedupe: lowercase scheme/host, no fragment or trailing slash."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+
+# Retry policy for rate limits (429) and transient upstream failures
+EXA_MAX_RETRIES = 3
+EXA_RETRY_BASE_DELAY = 1.0
+EXA_RETRY_MAX_DELAY = 8.0
+
+# exa_py surfaces HTTP errors as ValueError("Request failed with status code NNN: ...")
+_RETRYABLE_STATUS = re.compile(r"status code (429|5\d\d)\b")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limits, 5xx responses and connection drops are worth retrying."""
+    if isinstance(error, (ConnectionError, requests.ConnectionError)):
+        return True
+    return isinstance(error, ValueError) and bool(_RETRYABLE_STATUS.search(str(error)))
+
+
 class ExaSearchClient:
     """Client for Exa Search API with answer synthesis."""
 
@@ -45,10 +72,7 @@ class ExaSearchClient:
         logfire.info("Exa search", query=query[:100])
 
         try:
-            result = await asyncio.wait_for(
-                asyncio.to_thread(self.exa.answer, query=query, text=True),
-                timeout=timeout
-            )
+            result = await self._answer_with_retry(query, timeout)
 
             citations = [
                 ExaCitation(
@@ -75,6 +99,28 @@ class ExaSearchClient:
             logfire.error("Exa error", error_type=type(e).__name__, error=str(e)[:500])
             raise
 
+    async def _answer_with_retry(self, query: str, timeout: float):
+        """Call Exa answer, retrying rate limits and transient errors with jittered backoff."""
+        for attempt in range(EXA_MAX_RETRIES + 1):
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(self.exa.answer, query=query, text=True),
+                    timeout=timeout
+                )
+            except Exception as e:
+                if attempt == EXA_MAX_RETRIES or not _is_retryable(e):
+                    raise
+                # Full jitter keeps concurrent workers from retrying in lockstep
+                delay = random.uniform(0, min(EXA_RETRY_MAX_DELAY, EXA_RETRY_BASE_DELAY * 2 ** attempt))
+                logfire.warning(
+                    "Exa request failed, retrying",
+                    attempt=attempt + 1,
+                    max_retries=EXA_MAX_RETRIES,
+                    delay=round(delay, 2),
+                    error=str(e)[:200]
+                )
+                await asyncio.sleep(delay)
+
     async def dual_answer(
         self,
         background_query: str,
@@ -123,16 +169,15 @@ class ExaSearchClient:
         background_citations: List[ExaCitation],
         publications_citations: List[ExaCitation]
     ) -> List[ExaCitation]:
-        """Deduplicate by URL, prioritizing publications citations."""
-        seen = set()
+        """Deduplicate by normalized URL, prioritizing publications citations."""
+        seen: set[str] = set()
         result = []
         # Publications first (priority)
-        for c in publications_citations:
-            if c.url not in seen:
-                seen.add(c.url)
-                result.append(c)
-        for c in background_citations:
-            if c.url not in seen:
-                seen.add(c.url)
+        for c in (*publications_citations, *background_citations):
+            if not c.url:
+                continue
+            key = _normalize_url(c.url)
+            if key not in seen:
+                seen.add(key)
                 result.append(c)
         return result
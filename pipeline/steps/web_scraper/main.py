@@ -107,8 +107,7 @@ class WebScraperStep(BasePipelineStep):
                 pub_len=len(result.publications.answer),
                 citations=len(result.all_citations),
                 background_summary=result.background.answer,
-                publications_summary=result.publications.answer,
-                combined_summary=result.combined_answer
+                publications_summary=result.publications.answer
             )
 
             return StepResult(
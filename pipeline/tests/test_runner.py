@@ -0,0 +1,183 @@
+"""
+Unit tests for PipelineRunner dependency scheduling.
+
+Uses in-memory fake steps only; no external services are required.
+
+Run with:
+    pytest pipeline/tests/test_runner.py -v
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from pipeline.core.exceptions import StepExecutionError
+from pipeline.core.runner import BasePipelineStep, PipelineRunner
+from pipeline.models.core import PipelineData, StepResult
+
+
+class _RecordingStep(BasePipelineStep):
+    """Fake step that records start/finish order and optionally fails."""
+
+    def __init__(self, step_name: str, events: List[str], delay: float = 0.0, fail: bool = False):
+        super().__init__(step_name=step_name)
+        self.events = events
+        self.delay = delay
+        self.fail = fail
+
+    async def _execute_step(self, pipeline_data: PipelineData) -> StepResult:
+        self.events.append(f"start:{self.step_name}")
+        await asyncio.sleep(self.delay)
+        self.events.append(f"end:{self.step_name}")
+        if self.fail:
+            return StepResult(success=False, step_name=self.step_name, error="boom")
+        if self.step_name == "compose":
+            pipeline_data.metadata["email_id"] = "email-1"
+        return StepResult(success=True, step_name=self.step_name)
+
+
+def _pipeline_data() -> PipelineData:
+    return PipelineData(
+        task_id="task-1",
+        user_id="user-1",
+        email_template="Hi {{name}}",
+        recipient_name="Dr. Jane Smith",
+        recipient_interest="machine learning",
+    )
+
+
+@pytest.mark.unit
+async def test_independent_steps_run_concurrently():
+    """Steps sharing only an upstream dependency overlap; the join step waits for both."""
+    events: List[str] = []
+    runner = PipelineRunner()
+    runner.register_step(_RecordingStep("parse", events))
+    runner.register_step(_RecordingStep("scrape", events, delay=0.01), depends_on=["parse"])
+    runner.register_step(_RecordingStep("arxiv", events, delay=0.01), depends_on=["parse"])
+    runner.register_step(_RecordingStep("compose", events), depends_on=["scrape", "arxiv"])
+
+    email_id = await runner.run(_pipeline_data())
+
+    assert email_id == "email-1"
+    assert events[:4] == ["start:parse", "end:parse", "start:scrape", "start:arxiv"]
+    assert events[-2:] == ["start:compose", "end:compose"]
+
+
+@pytest.mark.unit
+async def test_default_registration_is_sequential():
+    """Without depends_on, each step waits for the previously registered one."""
+    events: List[str] = []
+    runner = PipelineRunner([
+        _RecordingStep("parse", events),
+        _RecordingStep("scrape", events),
+        _RecordingStep("compose", events),
+    ])
+
+    await runner.run(_pipeline_data())
+
+    assert events == [
+        "start:parse", "end:parse",
+        "start:scrape", "end:scrape",
+        "start:compose", "end:compose",
+    ]
+
+
+@pytest.mark.unit
+async def test_failed_concurrent_step_stops_pipeline():
+    """A failing step in a concurrent batch raises and downstream steps never start."""
+    events: List[str] = []
+    runner = PipelineRunner()
+    runner.register_step(_RecordingStep("parse", events))
+    runner.register_step(_RecordingStep("scrape", events, fail=True), depends_on=["parse"])
+    runner.register_step(_RecordingStep("arxiv", events), depends_on=["parse"])
+    runner.register_step(_RecordingStep("compose", events), depends_on=["scrape", "arxiv"])
+
+    with pytest.raises(StepExecutionError):
+        await runner.run(_pipeline_data())
+
+    assert "start:compose" not in events
+
+
+@pytest.mark.unit
+def test_unregistered_dependency_is_rejected():
+    """Dependencies must be registered first, which keeps the step graph acyclic."""
+    runner = PipelineRunner()
+    with pytest.raises(ValueError):
+        runner.register_step(_RecordingStep("compose", []), depends_on=["missing"])
+
+
+class _CachedParseStep(BasePipelineStep):
+    """Fake cacheable step that counts how often its logic actually runs."""
+
+    cache_ttl_seconds = 60
+    cache_input_fields = ("email_template", "recipient_name", "recipient_interest")
+    cache_output_fields = ("search_terms",)
+
+    def __init__(self):
+        super().__init__(step_name="cached_parse_test")
+        self.calls = 0
+
+    async def _execute_step(self, pipeline_data: PipelineData) -> StepResult:
+        self.calls += 1
+        pipeline_data.search_terms = [pipeline_data.recipient_name]
+        return StepResult(success=True, step_name=self.step_name)
+
+
+@pytest.mark.unit
+async def test_cached_step_skips_execution_for_identical_inputs():
+    """Second run with the same inputs restores outputs without executing the step."""
+    step = _CachedParseStep()
+
+    first = _pipeline_data()
+    await step.execute(first)
+    second = _pipeline_data()
+    result = await step.execute(second)
+
+    assert step.calls == 1
+    assert result.metadata["cache_hit"] is True
+    assert second.search_terms == ["Dr. Jane Smith"]
+
+    changed = _pipeline_data()
+    changed.recipient_name = "Dr. John Doe"
+    await step.execute(changed)
+
+    assert step.calls == 2
+    assert changed.search_terms == ["Dr. John Doe"]
+
+
+@pytest.mark.unit
+async def test_returned_failure_is_recorded_once():
+    """A success=False result raises with the step's message and is logged in errors."""
+    runner = PipelineRunner([_RecordingStep("scrape", [], fail=True)])
+    pipeline_data = _pipeline_data()
+
+    with pytest.raises(StepExecutionError) as exc_info:
+        await runner.run(pipeline_data)
+
+    assert exc_info.value.step_name == "scrape"
+    assert str(exc_info.value.original_error) == "boom"
+    assert pipeline_data.errors == ["scrape: boom"]
+
+
+class _SkippedStep(_RecordingStep):
+    """Fake conditional step that always opts out."""
+
+    def should_run(self, pipeline_data: PipelineData) -> bool:
+        return False
+
+
+@pytest.mark.unit
+async def test_skipped_step_is_not_executed_and_unblocks_dependents():
+    """should_run=False skips execute() but still satisfies downstream dependencies."""
+    events: List[str] = []
+    runner = PipelineRunner()
+    runner.register_step(_RecordingStep("parse", events))
+    runner.register_step(_SkippedStep("arxiv", events), depends_on=["parse"])
+    runner.register_step(_RecordingStep("compose", events), depends_on=["arxiv"])
+
+    pipeline_data = _pipeline_data()
+    await runner.run(pipeline_data)
+
+    assert events == ["start:parse", "end:parse", "start:compose", "end:compose"]
+    assert "arxiv" not in pipeline_data.step_timings
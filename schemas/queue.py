@@ -130,7 +130,7 @@ class QueueItemResponse(BaseModel):
 
     current_step: str | None = Field(
         None,
-        description="Current pipeline step (if processing)"
+        description="Current pipeline step (if processing); while steps run in parallel, the first step of that group"
     )
 
     created_at: datetime = Field(..., description="When item was queued")
@@ -1,7 +1,6 @@
 """Root conftest.py for pytest configuration.
 
 This file configures pytest for the entire project, ensuring:
-- Proper Python path setup for imports
 - Logfire observability configuration
 - Shared fixtures across all tests
 - Async test support
@@ -14,53 +13,48 @@ from pathlib import Path
 import logfire
 import pytest
 
+# Set once pytest_configure has configured Logfire for this run
+_logfire_configured = False
+
 
 # ============================================================================
-# Python Path Configuration
+# Session Configuration
 # ============================================================================
 
 def pytest_configure(config):
-    """Configure pytest with custom settings and ensure project root is in sys.path."""
+    """Configure pytest with custom settings (project root is put on sys.path via pytest.ini pythonpath)."""
+    global _logfire_configured
 
-    # Add project root to sys.path to ensure 'pipeline' package is importable
-    project_root = Path(__file__).parent.resolve()
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
+    # Custom markers are registered in pytest.ini (no need to re-add them here)
 
-    # Register custom markers
-    config.addinivalue_line(
-        "markers",
-        "slow: marks tests as slow (deselect with '-m \"not slow\"')"
-    )
-    config.addinivalue_line(
-        "markers",
-        "integration: marks tests as integration tests requiring external services"
-    )
-    config.addinivalue_line(
-        "markers",
-        "unit: marks tests as unit tests (fast, no external dependencies)"
-    )
+    # Skip Logfire setup for collection-only runs or when explicitly disabled
+    if config.option.collectonly or os.getenv("DISABLE_LOGFIRE_TESTS"):
+        return
 
     # Configure logfire for all tests
     logfire.configure(
         service_name="pythonserver_tests",
         environment="test",
-        send_to_logfire=True,  # Send test logs to remote server for debugging
+        send_to_logfire="if-token-present",  # Send test logs to remote server only when a token is set
         token=os.getenv("LOGFIRE_TOKEN"),  # Authenticate with Logfire server, we purposely do not use the settings.logfire_token here to prevent conflicts with the main application.
     )
+    _logfire_configured = True
 
     # Ensure pydantic-ai agents emit detailed spans (inputs/outputs) in tests
     logfire.instrument_pydantic_ai()
 
     logfire.info(
         "Starting test suite",
-        project_root=str(project_root),
+        project_root=str(config.rootpath),
         python_path=sys.path[:3],  # Log first 3 paths for debugging
     )
 
 
 def pytest_sessionfinish(session, exitstatus):
     """Log test session completion with summary statistics."""
+    if not _logfire_configured:
+        return
+
     logfire.info(
         "Test suite completed",
         exit_status=exitstatus,
@@ -5,12 +5,15 @@ This module provides a singleton Supabase client instance using the service role
 for administrative operations like JWT validation and database operations.
 """
 
+import threading
+
 import logfire
 from supabase import create_client, Client
 from config import settings
 
 # Global singleton instance
 _supabase_client: Client | None = None
+_supabase_client_lock = threading.Lock()
 
 
 def get_supabase_client() -> Client:
@@ -29,24 +32,29 @@ def get_supabase_client() -> Client:
     """
     global _supabase_client
 
-    if _supabase_client is None:
-        if not settings.supabase_url:
-            raise ValueError("SUPABASE_URL is not configured")
-        if not settings.supabase_service_role_key:
-            raise ValueError("SUPABASE_SERVICE_ROLE_KEY is not configured")
-
-        try:
-            _supabase_client = create_client(
-                settings.supabase_url,
-                settings.supabase_service_role_key
-            )
-        except Exception as e:
-            logfire.error(
-                "Failed to initialize Supabase client",
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            raise
+    if _supabase_client is not None:
+        return _supabase_client
+
+    # Double-checked so concurrent first calls (threadpool deps, workers) build one client
+    with _supabase_client_lock:
+        if _supabase_client is None:
+            if not settings.supabase_url:
+                raise ValueError("SUPABASE_URL is not configured")
+            if not settings.supabase_service_role_key:
+                raise ValueError("SUPABASE_SERVICE_ROLE_KEY is not configured")
+
+            try:
+                _supabase_client = create_client(
+                    settings.supabase_url,
+                    settings.supabase_service_role_key
+                )
+            except Exception as e:
+                logfire.error(
+                    "Failed to initialize Supabase client",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                raise
 
     return _supabase_client
 
@@ -5,11 +5,12 @@ Celery tasks responsible for orchestrating the email generation pipeline.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 import logfire
 from celery.exceptions import Ignore
+from sqlalchemy import and_, func, or_, update
 
 from celery_config import celery_app
 from database.session import get_db_context
@@ -26,6 +27,14 @@ JOB_STATUS_TO_CELERY_STATE = {
     JobStatus.FAILED: "FAILURE",
 }
 
+# A PROCESSING claim older than this is treated as abandoned by a lost worker and
+# may be re-claimed. Matches the broker's visibility timeout (Redis default 1h),
+# after which an unacknowledged acks_late task is redelivered.
+STALE_CLAIM_SECONDS = celery_app.conf.broker_transport_options.get("visibility_timeout", 3600)
+
+# Delay before retrying a task whose queue-item claim hit a database error
+CLAIM_RETRY_COUNTDOWN_SECONDS = 30
+
 
 @celery_app.task(bind=True, max_retries=1)
 def generate_email_task(
@@ -121,6 +130,50 @@ def generate_email_task(
                 error=str(e)
             )
 
+    def claim_queue_item() -> bool:
+        """
+        Atomically move the queue item to PROCESSING in one UPDATE ... RETURNING.
+
+        Only PENDING rows are claimable, plus PROCESSING rows whose claim is older
+        than STALE_CLAIM_SECONDS (a lost worker's task redelivered by acks_late).
+        Returns False when the row was cancelled (deleted), already finished, or
+        is being processed by another delivery of the same task, so the pipeline
+        never runs twice for one queue item.
+
+        Raises:
+            Exception: Database errors propagate so the caller can fail closed
+        """
+        if not queue_item_id:
+            return True
+
+        stale_before = func.now() - timedelta(seconds=STALE_CLAIM_SECONDS)
+        with get_db_context() as db:
+            claimed_id = db.execute(
+                update(QueueItem)
+                .where(
+                    QueueItem.id == queue_item_id,
+                    or_(
+                        QueueItem.status == QueueStatus.PENDING,
+                        and_(
+                            QueueItem.status == QueueStatus.PROCESSING,
+                            or_(
+                                QueueItem.started_at.is_(None),
+                                QueueItem.started_at < stale_before,
+                            ),
+                        ),
+                    ),
+                )
+                .values(
+                    status=QueueStatus.PROCESSING,
+                    current_step="initializing",
+                    # A re-claim restarts the clock so the new owner isn't immediately stale
+                    started_at=func.now(),
+                )
+                .returning(QueueItem.id)
+            ).scalar_one_or_none()
+            db.commit()
+            return claimed_id is not None
+
     def reset_queue_item_for_retry() -> None:
         """Reset queue item back to PENDING state before a retry attempt."""
         if not queue_item_id:
@@ -195,8 +248,16 @@ def generate_email_task(
         template_type=template_type,
     )
 
+    # Built per task: asyncio.run() below gives each task a new event loop, and
+    # the steps' pydantic-ai agents hold httpx clients bound to the loop they
+    # first ran on, so a runner must not outlive its task.
     runner = create_email_pipeline()
 
+    # Steps currently executing. Independent steps (web_scraper/arxiv_helper)
+    # run concurrently, and the queue row's current_step then shows the first
+    # step of that wave in pipeline order, so it always holds a single step name.
+    running_steps: set[str] = set()
+
     async def progress_callback(step_name: str, step_status: str) -> None:
         _update_status(
             JobStatus.RUNNING,
@@ -206,8 +267,23 @@ def generate_email_task(
                 "step_timings": pipeline_data.step_timings,
             },
         )
-        # Also update database queue status
-        update_queue_status(QueueStatus.PROCESSING, current_step=step_name)
+
+        # Bookkeeping happens before any await: concurrent steps report
+        # "started" in registration order, so only the wave's first step writes.
+        starts_wave = step_status == "started" and not running_steps
+        if step_status == "started":
+            running_steps.add(step_name)
+        else:
+            running_steps.discard(step_name)
+
+        # The queue row only tracks current_step, which changes when a wave
+        # starts; completed/failed transitions are covered by the next wave's
+        # start or the task's terminal status write, so skip their round-trips.
+        # The sync DB write runs in a thread so sibling steps' I/O isn't blocked.
+        if starts_wave:
+            await asyncio.to_thread(
+                update_queue_status, QueueStatus.PROCESSING, current_step=step_name
+            )
 
     async def _execute_pipeline() -> str:
         return await runner.run(pipeline_data, progress_callback=progress_callback)
@@ -225,6 +301,26 @@ def generate_email_task(
             user_id=user_id,
         )
 
+        try:
+            claimed = claim_queue_item()
+        except Exception as exc:
+            # Fail closed: running unclaimed could duplicate another worker's generation
+            logfire.error(
+                "Failed to claim queue item, retrying task",
+                task_id=public_task_id,
+                queue_item_id=queue_item_id,
+                error=str(exc),
+            )
+            raise self.retry(exc=exc, countdown=CLAIM_RETRY_COUNTDOWN_SECONDS)
+
+        if not claimed:
+            logfire.info(
+                "Queue item cancelled, finished or claimed by another delivery, skipping task",
+                task_id=public_task_id,
+                queue_item_id=queue_item_id,
+            )
+            raise Ignore()
+
         _update_status(
             JobStatus.RUNNING,
             {
@@ -232,8 +328,6 @@ def generate_email_task(
                 "step_status": "started",
             },
         )
-        # Update database queue status
-        update_queue_status(QueueStatus.PROCESSING, current_step="initializing")
 
         try:
             email_id = asyncio.run(_execute_pipeline())
@@ -307,6 +401,11 @@ def generate_email_task(
             # Raise Ignore to prevent Celery from overwriting FAILURE state with SUCCESS
             raise Ignore()
 
+        finally:
+            # Only timings/errors/template_type are read past this point; free the
+            # scraped pages and papers before the status writes and result payload
+            pipeline_data.release_intermediates()
+
         total_duration = pipeline_data.total_duration()
         template_type_value = (
             pipeline_data.template_type.value if pipeline_data.template_type else None
@@ -1,15 +1,14 @@
 """Utilities for creating instrumented pydantic-ai agents."""
 
 import logging
-from typing import Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel
-from pydantic_ai import Agent
 
-from config.settings import get_settings
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 T = TypeVar("T", bound=Union[BaseModel, str])
 
@@ -41,8 +40,12 @@ def create_agent(
     max_tokens: int = 2000,
     retries: int = 2,
     timeout: Optional[float] = None,
-) -> Agent[None, T]:
+) -> "Agent[None, T]":
     """Create a pydantic-ai Agent with optional output validation."""
+    # Imported on first use: pydantic-ai takes ~0.5s to import and the API process
+    # only needs it when a template is generated
+    from pydantic_ai import Agent
+
     resolved_output_type = _resolve_output_type(output_type)
     prompt = system_prompt or _default_system_prompt(resolved_output_type)
 
@@ -2,25 +2,56 @@
 
 import httpx
 import logfire
-import re
 from pypdf import PdfReader
 from io import BytesIO
 
+# Hard cap on downloaded PDF size (resumes are typically well under 1MB).
+# Keeps worker memory bounded when a URL points at an oversized or non-PDF file.
+MAX_PDF_BYTES = 10 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Joins per-page text so the last word of a page never fuses with the next page's first word
+PAGE_SEPARATOR = "\n"
+
+
+async def _download_pdf(pdf_url: str, timeout: int) -> BytesIO:
+    """Stream PDF bytes from URL, aborting once MAX_PDF_BYTES is exceeded."""
+    buffer = BytesIO()
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        async with client.stream("GET", pdf_url) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            if content_type.startswith("text/html"):
+                raise ValueError(f"URL did not return a PDF (content-type: {content_type})")
+
+            declared_length = int(response.headers.get("content-length") or 0)
+            if declared_length > MAX_PDF_BYTES:
+                raise ValueError(
+                    f"PDF is too large ({declared_length} bytes, max {MAX_PDF_BYTES})"
+                )
+
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+                if buffer.tell() > MAX_PDF_BYTES:
+                    raise ValueError(f"PDF is too large (max {MAX_PDF_BYTES} bytes)")
+
+    buffer.seek(0)
+    return buffer
+
 
 async def extract_text_from_url(pdf_url: str, timeout: int = 30) -> str:
     """Extract text content from PDF at given URL using pypdf."""
     with logfire.span("pdf_parser.extract_text_from_url", pdf_url=pdf_url):
         try:
-            # Fetch PDF from URL
+            # Fetch PDF from URL (streamed with a size cap)
             logfire.info("Fetching PDF from URL", pdf_url=pdf_url)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(pdf_url)
-                response.raise_for_status()
+            pdf_bytes = await _download_pdf(pdf_url, timeout)
 
-            logfire.info("PDF fetched successfully", size_bytes=len(response.content))
+            logfire.info("PDF fetched successfully", size_bytes=pdf_bytes.getbuffer().nbytes)
 
             # Parse PDF
-            pdf_bytes = BytesIO(response.content)
             reader = PdfReader(pdf_bytes)
 
             # Validate PDF has pages
@@ -30,10 +61,8 @@ async def extract_text_from_url(pdf_url: str, timeout: int = 30) -> str:
 
             logfire.info("PDF parsed", page_count=len(reader.pages))
 
-            # Extract text from all pages
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
+            # Extract text from all pages (single join instead of repeated +=)
+            text = PAGE_SEPARATOR.join(page.extract_text() or "" for page in reader.pages)
 
             # Clean the extracted text
             text = clean_text(text)
@@ -76,11 +105,6 @@ async def extract_text_from_url(pdf_url: str, timeout: int = 30) -> str:
 
 
 def clean_text(raw_text: str) -> str:
-    # Collapse multiple spaces into single space
-    text = " ".join(raw_text.split())
-
-    # Limit consecutive newlines to maximum of 2 (preserve paragraph structure)
-    text = re.sub(r'\n{3,}', '\n\n', text)
-
-    # Strip leading/trailing whitespace
-    return text.strip()
+    """Collapse all whitespace runs (spaces, tabs, newlines) to single spaces in one pass."""
+    # str.split() with no args also drops leading/trailing whitespace
+    return " ".join(raw_text.split())
@@ -1,5 +1,7 @@
-"""Helper for converting string UUIDs to UUID objects."""
+"""Helpers for converting string UUIDs to UUID objects and generating time-ordered IDs."""
 
+import os
+import time
 from uuid import UUID
 from typing import Union
 
@@ -13,3 +15,17 @@ def ensure_uuid(value: Union[str, UUID]) -> UUID:
         return UUID(value)
     except (ValueError, AttributeError) as e:
         raise ValueError(f"Invalid UUID format: {value}") from e
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The 48-bit millisecond timestamp prefix makes new primary keys land at the
+    right edge of the btree index instead of random pages, unlike uuid4.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return UUID(int=value)